@@ -101,7 +101,7 @@ def check_and_award_badges(user: User) -> List[UserBadge]:
     # Batch create activity feed entries
     if activity_entries:
         from analytics.models import LiveActivityFeed
-        LiveActivityFeed.objects.bulk_create(activity_entries)
+        LiveActivityFeed.bulk_log(activity_entries)
 
     return newly_awarded
 
@@ -236,14 +236,10 @@ def _get_user_statistics(user: User) -> Dict[str, Any]:
 
     compliance_rate = (compliant_breaks / total_breaks * 100) if total_breaks > 0 else 0
 
-    # Calculate perfect days (days with 100% compliance) - Using database fields
-    # A perfect day is when all breaks are compliant
-    from django.db.models import F
+    # Calculate perfect days (days with 100% compliance) from the stored rate
     perfect_days = DailyStats.objects.filter(
         user=user,
-        total_breaks_taken__gt=0
-    ).extra(
-        where=["breaks_compliant = total_breaks_taken"]
+        compliance_rate=100.0
     ).count()
 
     return {
@@ -3,6 +3,7 @@ API views for real-time analytics and metrics
 """
 from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
+from django.views.decorators.gzip import gzip_page
 from django.views.decorators.http import require_http_methods
 from django.utils import timezone
 from django.db.models import Sum, Count, Avg, Q
@@ -15,6 +16,7 @@ from .models import (
 )
 from timer.models import TimerSession, BreakRecord
 from accounts.models import User
+from mysite.utils import transpose_rows
 
 
 @login_required
@@ -62,24 +64,20 @@ def dashboard_metrics_api(request):
         date=today
     )
 
-    # Calculate real-time metrics for today
-    today_sessions = TimerSession.objects.filter(
-        user=request.user,
-        start_time__date=today
-    )
-
+    # Calculate compliance rate for today in one aggregate
     today_breaks = BreakRecord.objects.filter(
         user=request.user,
         break_start_time__date=today,
         break_completed=True
+    ).aggregate(
+        total=Count('id'),
+        compliant=Count('id', filter=Q(
+            break_duration_seconds__gte=20,
+            looked_at_distance=True
+        ))
     )
-
-    # Calculate compliance rate
-    total_breaks = today_breaks.count()
-    compliant_breaks = today_breaks.filter(
-        break_duration_seconds__gte=20,
-        looked_at_distance=True
-    ).count()
+    total_breaks = today_breaks['total']
+    compliant_breaks = today_breaks['compliant']
 
     compliance_rate = (compliant_breaks / total_breaks * 100) if total_breaks > 0 else 0
 
@@ -89,9 +87,11 @@ def dashboard_metrics_api(request):
         user=request.user,
         start_time__date__gte=week_start,
         start_time__date__lte=today
+    ).aggregate(
+        count=Count('id'),
+        work_minutes=Sum('total_work_minutes')
     )
 
-    week_work_minutes = sum(session.total_work_minutes for session in week_sessions)
     week_breaks = BreakRecord.objects.filter(
         user=request.user,
         break_start_time__date__gte=week_start,
@@ -109,9 +109,9 @@ def dashboard_metrics_api(request):
             'compliance_rate': compliance_rate
         },
         'week': {
-            'work_minutes': week_work_minutes,
+            'work_minutes': week_sessions['work_minutes'] or 0,
             'breaks_taken': week_breaks,
-            'sessions': week_sessions.count()
+            'sessions': week_sessions['count']
         },
         'streaks': _get_user_streak_data(request.user),
         'achievements': _get_recent_achievements(request.user)
@@ -127,10 +127,11 @@ def live_feed_api(request):
     # Get recent public activities
     activities = LiveActivityFeed.get_recent_public_activities(limit=15)
 
+    now = timezone.now()
     activity_data = []
     for activity in activities:
         # Calculate time ago
-        time_diff = timezone.now() - activity.timestamp
+        time_diff = now - activity.timestamp
         if time_diff.days > 0:
             time_ago = f"{time_diff.days}d ago"
         elif time_diff.seconds > 3600:
@@ -182,9 +183,7 @@ def submit_rating_api(request):
             days_since_signup=(timezone.now().date() - request.user.date_joined.date()).days
         )
 
-        # Update real-time metrics
-        metrics = RealTimeMetrics.get_latest_metrics()
-        metrics.update_metrics()
+        # Real-time metrics pick the rating up on the next periodic update
 
         return JsonResponse({
             'success': True,
@@ -234,6 +233,7 @@ def track_activity_api(request):
 
 @login_required
 @require_http_methods(["GET"])
+@gzip_page
 def user_stats_summary_api(request):
     """
     API endpoint for user statistics summary
@@ -249,25 +249,40 @@ def user_stats_summary_api(request):
         date__lte=end_date
     ).order_by('date')
 
-    # Calculate totals and averages
-    total_work_minutes = sum(stat.total_work_minutes for stat in daily_stats)
-    total_breaks = sum(stat.total_breaks_taken for stat in daily_stats)
-    total_sessions = sum(stat.total_sessions for stat in daily_stats)
-
-    active_days = daily_stats.filter(total_sessions__gt=0).count()
-    avg_compliance = sum(stat.compliance_rate for stat in daily_stats) / max(1, len(daily_stats))
+    # Calculate totals and averages in a single query
+    period_stats = daily_stats.aggregate(
+        days_recorded=Count('id'),
+        work_minutes=Sum('total_work_minutes'),
+        breaks=Sum('total_breaks_taken'),
+        sessions=Sum('total_sessions'),
+        active_days=Count('id', filter=Q(total_sessions__gt=0)),
+        avg_work_minutes=Avg('total_work_minutes'),
+        avg_breaks=Avg('total_breaks_taken'),
+        avg_compliance=Avg('compliance_rate')
+    )
 
-    # Prepare chart data
+    total_work_minutes = period_stats['work_minutes'] or 0
+    total_breaks = period_stats['breaks'] or 0
+    total_sessions = period_stats['sessions'] or 0
+    active_days = period_stats['active_days']
+    avg_compliance = period_stats['avg_compliance'] or 0
+
+    # Prepare chart data from plain tuples rather than model instances
+    fields = ('date', 'total_work_minutes', 'total_breaks_taken', 'compliance_rate', 'productivity_score')
+    rows = daily_stats.values_list(*fields)
+    dates, work_minutes, breaks_taken, compliance_rates, productivity_scores = (
+        transpose_rows(rows, len(fields))
+    )
     chart_data = {
-        'dates': [stat.date.strftime('%Y-%m-%d') for stat in daily_stats],
-        'work_minutes': [stat.total_work_minutes for stat in daily_stats],
-        'breaks_taken': [stat.total_breaks_taken for stat in daily_stats],
-        'compliance_rates': [stat.compliance_rate for stat in daily_stats],
-        'productivity_scores': [stat.productivity_score for stat in daily_stats]
+        'dates': [stat_date.strftime('%Y-%m-%d') for stat_date in dates],
+        'work_minutes': list(work_minutes),
+        'breaks_taken': list(breaks_taken),
+        'compliance_rates': list(compliance_rates),
+        'productivity_scores': list(productivity_scores)
     }
 
     # Get productivity insights
-    insights = _generate_productivity_insights(request.user, daily_stats)
+    insights = _generate_productivity_insights(request.user, period_stats)
 
     return JsonResponse({
         'success': True,
@@ -322,11 +337,11 @@ def _get_recent_achievements(user, limit=5):
         return []
 
 
-def _generate_productivity_insights(user, daily_stats):
-    """Generate productivity insights based on user's data"""
+def _generate_productivity_insights(user, period_stats):
+    """Generate productivity insights from the period aggregate of user_stats_summary_api"""
     insights = []
 
-    if not daily_stats:
+    if not period_stats['days_recorded']:
         insights.append({
             'type': 'welcome',
             'title': 'Welcome to EyeHealth 20-20-20!',
@@ -335,10 +350,9 @@ def _generate_productivity_insights(user, daily_stats):
         })
         return insights
 
-    # Calculate averages
-    avg_work_minutes = sum(stat.total_work_minutes for stat in daily_stats) / len(daily_stats)
-    avg_breaks = sum(stat.total_breaks_taken for stat in daily_stats) / len(daily_stats)
-    avg_compliance = sum(stat.compliance_rate for stat in daily_stats) / len(daily_stats)
+    avg_work_minutes = period_stats['avg_work_minutes']
+    avg_breaks = period_stats['avg_breaks']
+    avg_compliance = period_stats['avg_compliance']
 
     # Generate insights based on patterns
     if avg_compliance < 60:
@@ -25,18 +25,10 @@ class BulkStatsService:
     def update_daily_stats_bulk(users: List[User], target_date: date) -> None:
         """
         Bulk update daily statistics for multiple users to improve performance
-        Uses batch processing to minimize database queries
+        Upserts every user's row in one INSERT ... ON CONFLICT per batch, so
+        existing rows don't have to be read back first
         """
-        stats_to_create = []
-        stats_to_update = []
-
-        # Get existing stats for the target date
-        existing_stats = {
-            stat.user_id: stat for stat in DailyStats.objects.filter(
-                user__in=users,
-                date=target_date
-            ).select_related('user')
-        }
+        stats_to_upsert = []
 
         # Bulk query for session data
         session_data = TimerSession.objects.filter(
@@ -72,53 +64,28 @@ class BulkStatsService:
             user_session_data = session_lookup.get(user.id, {})
             user_break_data = break_lookup.get(user.id, {})
 
-            total_work_minutes = user_session_data.get('total_work_minutes', 0) or 0
-            total_intervals = user_session_data.get('total_intervals', 0) or 0
-            total_breaks = user_session_data.get('total_breaks', 0) or 0
-            session_count = user_session_data.get('session_count', 0) or 0
-
-            breaks_compliant = user_break_data.get('compliant_breaks', 0) or 0
-            avg_break_duration = user_break_data.get('avg_duration', 0.0) or 0.0
-
-            # Calculate compliance rate
-            total_breaks_taken = user_break_data.get('total_breaks', 0) or 0
-            compliance_rate = (breaks_compliant / total_breaks_taken * 100) if total_breaks_taken > 0 else 0.0
-
-            if user.id in existing_stats:
-                # Update existing stats
-                stats = existing_stats[user.id]
-                stats.total_work_minutes = total_work_minutes
-                stats.total_intervals_completed = total_intervals
-                stats.total_breaks_taken = total_breaks
-                stats.total_sessions = session_count
-                stats.breaks_compliant = breaks_compliant
-                stats.average_break_duration = avg_break_duration
-                stats_to_update.append(stats)
-            else:
-                # Create new stats
-                stats_to_create.append(DailyStats(
-                    user=user,
-                    date=target_date,
-                    total_work_minutes=total_work_minutes,
-                    total_intervals_completed=total_intervals,
-                    total_breaks_taken=total_breaks,
-                    total_sessions=session_count,
-                    breaks_compliant=breaks_compliant,
-                    average_break_duration=avg_break_duration
-                ))
-
-        # Bulk create and update
+            stats = DailyStats(
+                user=user,
+                date=target_date,
+                total_work_minutes=user_session_data.get('total_work_minutes', 0) or 0,
+                total_intervals_completed=user_session_data.get('total_intervals', 0) or 0,
+                total_breaks_taken=user_session_data.get('total_breaks', 0) or 0,
+                total_sessions=user_session_data.get('session_count', 0) or 0,
+                breaks_compliant=user_break_data.get('compliant_breaks', 0) or 0,
+                average_break_duration=user_break_data.get('avg_duration', 0.0) or 0.0
+            )
+            stats_to_upsert.append(stats)
+
         with transaction.atomic():
-            if stats_to_create:
-                DailyStats.objects.bulk_create(stats_to_create, batch_size=100)
-
-            if stats_to_update:
-                DailyStats.objects.bulk_update(
-                    stats_to_update,
-                    ['total_work_minutes', 'total_intervals_completed', 'total_breaks_taken',
-                     'total_sessions', 'breaks_compliant', 'average_break_duration'],
-                    batch_size=100
-                )
+            DailyStats.objects.bulk_create(
+                stats_to_upsert,
+                batch_size=100,
+                update_conflicts=True,
+                unique_fields=['user', 'date'],
+                update_fields=['total_work_minutes', 'total_intervals_completed', 'total_breaks_taken',
+                               'total_sessions', 'breaks_compliant', 'average_break_duration',
+                               'updated_at']
+            )
 
     @staticmethod
     def calculate_weekly_stats_bulk(users: List[User], week_start: date) -> None:
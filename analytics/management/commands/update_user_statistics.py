@@ -3,13 +3,71 @@ Management command to update and recalculate user statistics
 """
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from django.db.models import Sum, Count, Avg
+from django.db import connection, connections, transaction
+from django.db.models import Sum, Count, Avg, F, Q, DurationField, ExpressionWrapper
+from django.db.models.functions import Coalesce, ExtractHour, ExtractIsoWeekDay, Now
+import calendar
 from datetime import date, timedelta
+from functools import lru_cache
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, groupby, islice
+from operator import itemgetter
 
 from accounts.models import User, UserProfile, UserStreakData
 from analytics.models import DailyStats, WeeklyStats, MonthlyStats
 from timer.models import TimerSession, BreakRecord
 
+# Rows written per bulk_create/bulk_update transaction
+BATCH_SIZE = 1000
+
+# Users loaded and checked for existing stats per round trip
+USER_CHUNK_SIZE = 500
+
+# Users handed to each worker thread at a time
+WORKER_CHUNK_SIZE = 100
+
+# Users processed between progress lines
+PROGRESS_INTERVAL = 1000
+
+ONE_DAY = timedelta(days=1)
+
+DAILY_STATS_FIELDS = [
+    'total_work_minutes', 'total_intervals_completed', 'total_breaks_taken',
+    'total_sessions', 'breaks_on_time', 'breaks_compliant',
+    'average_break_duration', 'productivity_score', 'streak_maintained'
+]
+
+
+@lru_cache(maxsize=4096)
+def calculate_productivity_score(sessions, breaks, compliant_breaks, work_minutes):
+    """
+    Calculate productivity score (0-100)
+
+    Pure function of four small integers; most (user, day) cells share the
+    same inputs, so results are memoized across the whole run.
+    """
+    if sessions == 0:
+        return 0.0
+
+    # Compliance rate (40% weight)
+    compliance_rate = (compliant_breaks / breaks * 100) if breaks > 0 else 0
+
+    # Session consistency (30% weight)
+    consistency_score = min(100, sessions * 20)  # Up to 5 sessions = 100%
+
+    # Break frequency (30% weight)
+    expected_breaks = work_minutes // 20  # One break every 20 minutes
+    frequency_score = min(100, (breaks / max(1, expected_breaks)) * 100)
+
+    productivity_score = (
+        compliance_rate * 0.4 +
+        consistency_score * 0.3 +
+        frequency_score * 0.3
+    )
+
+    return round(productivity_score, 1)
+
 
 class Command(BaseCommand):
     help = 'Update and recalculate user statistics for accurate data display'
@@ -36,10 +94,24 @@ class Command(BaseCommand):
             action='store_true',
             help='Create missing user profiles and streak data'
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=8,
+            help='Threads used to calculate daily statistics (default: 8, always 1 on SQLite)'
+        )
+        parser.add_argument(
+            '--rollups-only',
+            action='store_true',
+            help='Only refresh weekly and monthly statistics from existing daily statistics'
+        )
 
     def handle(self, *args, **options):
         self.stdout.write('Starting user statistics update...')
 
+        # Resolve "today" once so every step agrees on the same date
+        self.today = date.today()
+
         # Get users to process
         if options['user_id']:
             users = User.objects.filter(id=options['user_id'])
@@ -54,23 +126,81 @@ class Command(BaseCommand):
         total_users = users.count()
         self.stdout.write(f'Processing {total_users} users...')
 
+        # DailyStats and streaks are maintained by the live timer path; leave them alone
+        if options['rollups_only']:
+            user_ids = list(users.values_list('id', flat=True))
+            self._update_weekly_stats(user_ids)
+            self._update_monthly_stats(user_ids)
+            self.stdout.write(
+                self.style.SUCCESS(f'Successfully updated rollups for {total_users} users')
+            )
+            return
+
         # Create missing profiles if requested
         if options['create_missing_profiles']:
             self._create_missing_profiles(users)
 
         # Update daily statistics
         days_to_process = options['days']
-        for i, user in enumerate(users, 1):
-            self.stdout.write(f'Processing user {i}/{total_users}: {user.email}')
-            self._update_user_daily_stats(user, days_to_process, options['force'])
-            self._update_user_streak_data(user, options['force'])
-
-            if i % 10 == 0:
-                self.stdout.write(f'Processed {i}/{total_users} users...')
+        force = options['force']
+        start_date = self.today - timedelta(days=days_to_process)
+
+        # Per-user reads are round-trip bound, so fan them out over threads.
+        # SQLite serialises access through a single file lock, so stay serial there.
+        workers = options['workers']
+        if connection.vendor == 'sqlite':
+            workers = 1
+        executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+
+        stats_to_create = []
+        stats_to_update = []
+        i = 0
+        try:
+            for user_chunk in self._chunked(users.iterator(chunk_size=USER_CHUNK_SIZE), USER_CHUNK_SIZE):
+                # Without --force existing rows are skipped, so one query per chunk
+                # tells us which (user, date) cells are already up to date
+                existing_dates = None
+                if not force:
+                    existing_dates = self._existing_daily_dates(
+                        [user.id for user in user_chunk], start_date, self.today
+                    )
+
+                if executor:
+                    results = chain.from_iterable(executor.map(
+                        lambda chunk: self._process_users_chunk(chunk, days_to_process, force, existing_dates),
+                        self._chunked(user_chunk, WORKER_CHUNK_SIZE)
+                    ))
+                else:
+                    results = self._process_users(user_chunk, days_to_process, force, existing_dates)
+
+                for _, created, updated in results:
+                    i += 1
+                    stats_to_create.extend(created)
+                    stats_to_update.extend(updated)
+
+                    # Commit one transaction per batch instead of one per row
+                    if len(stats_to_create) + len(stats_to_update) >= BATCH_SIZE:
+                        self._save_daily_stats(stats_to_create, stats_to_update)
+                        stats_to_create = []
+                        stats_to_update = []
+
+                    if i % PROGRESS_INTERVAL == 0:
+                        self.stdout.write(f'Processed {i}/{total_users} users...')
+        finally:
+            if executor:
+                executor.shutdown()
+
+        self._save_daily_stats(stats_to_create, stats_to_update)
+
+        # The remaining aggregates only need ids, not User instances
+        user_ids = list(users.values_list('id', flat=True))
+
+        # Recalculate streak data in bulk once daily stats are current
+        self._recompute_streaks_bulk(user_ids, options['force'])
 
         # Update weekly and monthly aggregations
-        self._update_weekly_stats(users)
-        self._update_monthly_stats(users)
+        self._update_weekly_stats(user_ids)
+        self._update_monthly_stats(user_ids)
 
         self.stdout.write(
             self.style.SUCCESS(f'Successfully updated statistics for {total_users} users')
@@ -80,59 +210,128 @@ class Command(BaseCommand):
         """Create missing user profiles and streak data"""
         self.stdout.write('Creating missing user profiles...')
 
-        profiles_created = 0
-        streak_data_created = 0
+        user_ids = list(users.values_list('id', flat=True))
 
-        for user in users:
-            # Create user profile if missing
-            profile, created = UserProfile.objects.get_or_create(
-                user=user,
-                defaults={
-                    'daily_screen_time_hours': 8.0,
-                    'timezone': 'UTC',
-                    'preferred_language': 'en'
-                }
+        # Create user profiles that are missing
+        existing_profiles = set(
+            UserProfile.objects.filter(user_id__in=user_ids).values_list('user_id', flat=True)
+        )
+        profiles_to_create = [
+            UserProfile(
+                user_id=user_id,
+                daily_screen_time_hours=8.0,
+                timezone='UTC',
+                preferred_language='en'
             )
-            if created:
-                profiles_created += 1
-
-            # Create streak data if missing
-            streak_data, created = UserStreakData.objects.get_or_create(
-                user=user,
-                defaults={
-                    'current_daily_streak': 0,
-                    'best_daily_streak': 0,
-                    'total_sessions_completed': 0,
-                    'total_break_time_minutes': 0,
-                    'average_session_length': 0.0
-                }
+            for user_id in user_ids
+            if user_id not in existing_profiles
+        ]
+        UserProfile.objects.bulk_create(profiles_to_create, ignore_conflicts=True, batch_size=BATCH_SIZE)
+        profiles_created = len(profiles_to_create)
+
+        # Create streak data that is missing
+        existing_streaks = set(
+            UserStreakData.objects.filter(user_id__in=user_ids).values_list('user_id', flat=True)
+        )
+        streaks_to_create = [
+            UserStreakData(
+                user_id=user_id,
+                current_daily_streak=0,
+                best_daily_streak=0,
+                total_sessions_completed=0,
+                total_break_time_minutes=0,
+                average_session_length=0.0
             )
-            if created:
-                streak_data_created += 1
+            for user_id in user_ids
+            if user_id not in existing_streaks
+        ]
+        UserStreakData.objects.bulk_create(streaks_to_create, ignore_conflicts=True, batch_size=BATCH_SIZE)
+        streak_data_created = len(streaks_to_create)
 
         self.stdout.write(
             f'Created {profiles_created} user profiles and {streak_data_created} streak data records'
         )
 
-    def _update_user_daily_stats(self, user, days, force=False):
-        """Update daily statistics for a user"""
-        end_date = date.today()
+    def _process_users(self, users, days, force, existing_dates):
+        """Yield (user, stats_to_create, stats_to_update) for each user"""
+        for user in users:
+            created, updated = self._update_user_daily_stats(
+                user, days, force,
+                existing_dates=None if existing_dates is None else existing_dates.get(user.id, set())
+            )
+            yield user, created, updated
+
+    def _process_users_chunk(self, users, days, force, existing_dates):
+        """Worker-thread entry point; releases the thread's DB connection when done"""
+        try:
+            return list(self._process_users(users, days, force, existing_dates))
+        finally:
+            connections.close_all()
+
+    def _existing_daily_dates(self, user_ids, start_date, end_date):
+        """Map each user id to the set of dates that already have DailyStats"""
+        existing_dates = defaultdict(set)
+        for user_id, stat_date in DailyStats.objects.filter(
+            user_id__in=user_ids,
+            date__gte=start_date,
+            date__lte=end_date
+        ).values_list('user_id', 'date'):
+            existing_dates[user_id].add(stat_date)
+        return existing_dates
+
+    def _update_user_daily_stats(self, user, days, force=False, existing_dates=None):
+        """
+        Build new and changed daily statistics for a user
+
+        ``existing_dates`` may carry the user's already-computed dates when the
+        caller fetched them in bulk; without it the user's rows are queried here.
+        """
+        end_date = self.today
         start_date = end_date - timedelta(days=days)
 
-        for single_date in self._daterange(start_date, end_date):
-            # Check if stats already exist
-            daily_stat, created = DailyStats.objects.get_or_create(
-                user=user,
-                date=single_date,
-                defaults=self._calculate_daily_stats(user, single_date)
-            )
+        # Check which stats already exist
+        if existing_dates is not None:
+            existing_stats = existing_dates
+        else:
+            existing_stats = {
+                stat.date: stat for stat in DailyStats.objects.filter(
+                    user=user,
+                    date__gte=start_date,
+                    date__lte=end_date
+                )
+            }
 
-            # Update existing stats if force is True
-            if not created and force:
+        stats_to_create = []
+        stats_to_update = []
+        for single_date in self._daterange(start_date, end_date):
+            if single_date not in existing_stats:
+                stats_to_create.append(DailyStats(
+                    user=user,
+                    date=single_date,
+                    **self._calculate_daily_stats(user, single_date)
+                ))
+            elif force:
+                # Update existing stats if force is True
+                daily_stat = existing_stats[single_date]
                 calculated_stats = self._calculate_daily_stats(user, single_date)
                 for key, value in calculated_stats.items():
                     setattr(daily_stat, key, value)
-                daily_stat.save()
+                stats_to_update.append(daily_stat)
+
+        return stats_to_create, stats_to_update
+
+    def _save_daily_stats(self, stats_to_create, stats_to_update):
+        """Write a batch of daily statistics in a single transaction"""
+        with transaction.atomic():
+            if stats_to_create:
+                DailyStats.objects.bulk_create(stats_to_create, batch_size=BATCH_SIZE)
+
+            if stats_to_update:
+                DailyStats.objects.bulk_update(
+                    stats_to_update,
+                    DAILY_STATS_FIELDS,
+                    batch_size=BATCH_SIZE
+                )
 
     def _calculate_daily_stats(self, user, target_date):
         """Calculate daily statistics for a specific date"""
@@ -149,28 +348,32 @@ class Command(BaseCommand):
             break_completed=True
         )
 
-        # Calculate basic metrics
-        total_work_minutes = sum(session.total_work_minutes for session in sessions)
-        total_intervals = sum(session.total_intervals_completed for session in sessions)
-        total_breaks = breaks.count()
-        total_sessions = sessions.count()
+        # Calculate basic and compliance metrics without loading rows
+        session_agg = sessions.aggregate(
+            count=Count('id'),
+            work_minutes=Sum('total_work_minutes'),
+            intervals=Sum('total_intervals_completed')
+        )
+        break_agg = breaks.aggregate(
+            count=Count('id'),
+            compliant=Count('id', filter=Q(
+                break_duration_seconds__gte=20,
+                looked_at_distance=True
+            )),
+            avg_duration=Avg('break_duration_seconds')
+        )
 
-        # Calculate compliance metrics
-        compliant_breaks = breaks.filter(
-            break_duration_seconds__gte=20,
-            looked_at_distance=True
-        ).count()
+        total_work_minutes = session_agg['work_minutes'] or 0
+        total_intervals = session_agg['intervals'] or 0
+        total_breaks = break_agg['count']
+        total_sessions = session_agg['count']
+        compliant_breaks = break_agg['compliant']
 
         breaks_on_time = 0  # Would need more complex calculation
-        average_break_duration = 0.0
-
-        if total_breaks > 0:
-            average_break_duration = sum(
-                br.break_duration_seconds for br in breaks
-            ) / total_breaks
+        average_break_duration = break_agg['avg_duration'] or 0.0
 
         # Calculate productivity score
-        productivity_score = self._calculate_productivity_score(
+        productivity_score = calculate_productivity_score(
             total_sessions, total_breaks, compliant_breaks, total_work_minutes
         )
 
@@ -186,151 +389,162 @@ class Command(BaseCommand):
             'streak_maintained': total_sessions > 0
         }
 
-    def _calculate_productivity_score(self, sessions, breaks, compliant_breaks, work_minutes):
-        """Calculate productivity score (0-100)"""
-        if sessions == 0:
-            return 0.0
-
-        # Compliance rate (40% weight)
-        compliance_rate = (compliant_breaks / breaks * 100) if breaks > 0 else 0
-
-        # Session consistency (30% weight)
-        consistency_score = min(100, sessions * 20)  # Up to 5 sessions = 100%
-
-        # Break frequency (30% weight)
-        expected_breaks = work_minutes // 20  # One break every 20 minutes
-        frequency_score = min(100, (breaks / max(1, expected_breaks)) * 100)
-
-        productivity_score = (
-            compliance_rate * 0.4 +
-            consistency_score * 0.3 +
-            frequency_score * 0.3
-        )
-
-        return round(productivity_score, 1)
+    def _recompute_streaks_bulk(self, user_ids, force=False):
+        """Update streak data for all users from grouped session/break aggregates"""
+        streak_map = {
+            streak.user_id: streak
+            for streak in UserStreakData.objects.filter(user_id__in=user_ids)
+        }
 
-    def _update_user_streak_data(self, user, force=False):
-        """Update user streak data based on daily statistics"""
-        streak_data, created = UserStreakData.objects.get_or_create(user=user)
+        # Missing rows are created now and always recalculated
+        missing = [
+            UserStreakData(user_id=user_id)
+            for user_id in user_ids
+            if user_id not in streak_map
+        ]
+        UserStreakData.objects.bulk_create(missing, batch_size=500)
+        created_ids = {streak.user_id for streak in missing}
+        for streak in UserStreakData.objects.filter(user_id__in=created_ids):
+            streak_map[streak.user_id] = streak
+
+        target_ids = streak_map.keys() if force else created_ids
+        if not target_ids:
+            return
 
-        if created or force:
-            # Recalculate from all sessions
-            all_sessions = TimerSession.objects.filter(
-                user=user,
+        session_aggs = {
+            item['user_id']: item
+            for item in TimerSession.objects.filter(
+                user_id__in=target_ids,
                 is_active=False
-            ).order_by('start_time')
-
-            if all_sessions.exists():
-                # Update total sessions
-                streak_data.total_sessions_completed = all_sessions.count()
-
-                # Calculate total break time
-                all_breaks = BreakRecord.objects.filter(
-                    user=user,
-                    break_completed=True
+            ).values('user_id').annotate(
+                count=Count('id'),
+                avg_duration=Avg(
+                    ExpressionWrapper(
+                        Coalesce('end_time', Now()) - F('start_time'),
+                        output_field=DurationField()
+                    )
                 )
-                total_break_seconds = sum(br.break_duration_seconds for br in all_breaks)
-                streak_data.total_break_time_minutes = total_break_seconds // 60
-
-                # Calculate average session length
-                total_duration = sum(session.duration_minutes for session in all_sessions)
-                streak_data.average_session_length = total_duration / all_sessions.count()
-
-                # Calculate current and best streaks
-                self._calculate_streaks(user, streak_data)
+            )
+        }
+        break_totals = dict(
+            BreakRecord.objects.filter(
+                user_id__in=session_aggs.keys(),
+                break_completed=True
+            ).values('user_id').annotate(
+                total=Sum('break_duration_seconds')
+            ).values_list('user_id', 'total')
+        )
 
-                streak_data.save()
+        streaks = self._calculate_streaks_bulk(session_aggs.keys())
+
+        to_update = []
+        for user_id, session_agg in session_aggs.items():
+            streak_data = streak_map[user_id]
+            streak_data.total_sessions_completed = session_agg['count']
+            streak_data.total_break_time_minutes = (break_totals.get(user_id) or 0) // 60
+            avg_duration = session_agg['avg_duration'] or timedelta()
+            streak_data.average_session_length = avg_duration.total_seconds() / 60
+            streak_data.current_daily_streak, streak_data.best_daily_streak = (
+                streaks.get(user_id, (0, 0))
+            )
+            to_update.append(streak_data)
+
+        UserStreakData.objects.bulk_update(
+            to_update,
+            fields=[
+                'total_sessions_completed', 'total_break_time_minutes',
+                'average_session_length', 'current_daily_streak', 'best_daily_streak'
+            ],
+            batch_size=500
+        )
 
-    def _calculate_streaks(self, user, streak_data):
-        """Calculate current and best daily streaks"""
-        # Get daily stats ordered by date
-        daily_stats = DailyStats.objects.filter(
-            user=user,
+    def _calculate_streaks_bulk(self, user_ids):
+        """Calculate current and best daily streaks for many users in one pass"""
+        # Active dates for every user, sorted by (user, date)
+        rows = DailyStats.objects.filter(
+            user_id__in=user_ids,
             total_sessions__gt=0
-        ).order_by('date')
-
-        if not daily_stats.exists():
-            streak_data.current_daily_streak = 0
-            streak_data.best_daily_streak = 0
-            return
-
-        # Calculate streaks
-        current_streak = 0
-        best_streak = 0
-        temp_streak = 0
-        last_date = None
-
-        for stat in daily_stats:
-            if last_date is None:
-                temp_streak = 1
-            elif stat.date == last_date + timedelta(days=1):
-                temp_streak += 1
-            else:
-                temp_streak = 1
-
-            best_streak = max(best_streak, temp_streak)
-            last_date = stat.date
+        ).order_by('user_id', 'date').values_list('user_id', 'date')
 
         # Current streak is only valid if it includes today or yesterday
-        today = date.today()
-        if last_date and last_date >= today - timedelta(days=1):
-            current_streak = temp_streak
-        else:
-            current_streak = 0
-
-        streak_data.current_daily_streak = current_streak
-        streak_data.best_daily_streak = best_streak
-
-    def _update_weekly_stats(self, users):
+        yesterday_ordinal = self.today.toordinal() - 1
+        streaks = {}
+
+        for user_id, user_rows in groupby(rows.iterator(), key=itemgetter(0)):
+            best_streak = 0
+            temp_streak = 0
+            last_ordinal = None
+
+            for _, stat_date in user_rows:
+                ordinal = stat_date.toordinal()
+                if last_ordinal is not None and ordinal == last_ordinal + 1:
+                    temp_streak += 1
+                else:
+                    temp_streak = 1
+                if temp_streak > best_streak:
+                    best_streak = temp_streak
+                last_ordinal = ordinal
+
+            current_streak = temp_streak if last_ordinal >= yesterday_ordinal else 0
+            streaks[user_id] = (current_streak, best_streak)
+
+        return streaks
+
+    def _update_weekly_stats(self, user_ids):
         """Update weekly aggregated statistics"""
         self.stdout.write('Updating weekly statistics...')
 
         # Get current week
-        today = date.today()
+        today = self.today
         week_start = today - timedelta(days=today.weekday())
         week_end = week_start + timedelta(days=6)
 
-        for user in users:
-            self._calculate_weekly_stats(user, week_start, week_end)
-
-    def _calculate_weekly_stats(self, user, week_start, week_end):
-        """Calculate weekly statistics for a user"""
-        daily_stats = DailyStats.objects.filter(
-            user=user,
+        # One grouped aggregate for every user's week
+        weekly_aggs = DailyStats.objects.filter(
+            user_id__in=user_ids,
             date__gte=week_start,
             date__lte=week_end
+        ).values('user_id').annotate(
+            work_minutes=Sum('total_work_minutes'),
+            intervals=Sum('total_intervals_completed'),
+            breaks=Sum('total_breaks_taken'),
+            sessions=Sum('total_sessions'),
+            compliant=Sum('breaks_compliant'),
+            active_days=Count('id', filter=Q(total_sessions__gt=0)),
+            avg_productivity=Avg('productivity_score')
         )
 
-        if daily_stats.exists():
-            weekly_stat, created = WeeklyStats.objects.get_or_create(
-                user=user,
-                week_start_date=week_start,
-                defaults={
-                    'week_end_date': week_end,
-                    'total_work_minutes': 0,
-                    'total_intervals_completed': 0,
-                    'total_breaks_taken': 0,
-                    'total_sessions': 0,
-                    'active_days': 0,
-                    'total_breaks_compliant': 0,
-                    'weekly_compliance_rate': 0.0,
-                    'weekly_productivity_score': 0.0
-                }
+        existing_weekly = {
+            stat.user_id: stat for stat in WeeklyStats.objects.filter(
+                user_id__in=user_ids,
+                week_start_date=week_start
             )
+        }
+
+        weekly_stats_to_create = []
+        weekly_stats_to_update = []
+
+        for stats_data in weekly_aggs:
+            weekly_stat = existing_weekly.get(stats_data['user_id'])
+            if weekly_stat is None:
+                weekly_stat = WeeklyStats(
+                    user_id=stats_data['user_id'],
+                    week_start_date=week_start,
+                    week_end_date=week_end
+                )
+                weekly_stats_to_create.append(weekly_stat)
+            else:
+                weekly_stats_to_update.append(weekly_stat)
 
-            # Calculate aggregated values
-            total_work_minutes = sum(stat.total_work_minutes for stat in daily_stats)
-            total_intervals = sum(stat.total_intervals_completed for stat in daily_stats)
-            total_breaks = sum(stat.total_breaks_taken for stat in daily_stats)
-            total_sessions = sum(stat.total_sessions for stat in daily_stats)
-            total_compliant = sum(stat.breaks_compliant for stat in daily_stats)
-            active_days = daily_stats.filter(total_sessions__gt=0).count()
+            total_work_minutes = stats_data['work_minutes']
+            total_breaks = stats_data['breaks']
+            total_compliant = stats_data['compliant']
+            active_days = stats_data['active_days']
 
-            # Update weekly stats
             weekly_stat.total_work_minutes = total_work_minutes
-            weekly_stat.total_intervals_completed = total_intervals
+            weekly_stat.total_intervals_completed = stats_data['intervals']
             weekly_stat.total_breaks_taken = total_breaks
-            weekly_stat.total_sessions = total_sessions
+            weekly_stat.total_sessions = stats_data['sessions']
             weekly_stat.active_days = active_days
             weekly_stat.total_breaks_compliant = total_compliant
 
@@ -342,70 +556,149 @@ class Command(BaseCommand):
                 weekly_stat.average_daily_work_minutes = total_work_minutes / active_days
                 weekly_stat.average_daily_breaks = total_breaks / active_days
 
-            # Calculate productivity score
-            avg_productivity = sum(stat.productivity_score for stat in daily_stats) / len(daily_stats)
-            weekly_stat.weekly_productivity_score = avg_productivity
-
-            weekly_stat.save()
+            weekly_stat.weekly_productivity_score = stats_data['avg_productivity']
+
+        with transaction.atomic():
+            if weekly_stats_to_create:
+                WeeklyStats.objects.bulk_create(weekly_stats_to_create, batch_size=500)
+
+            if weekly_stats_to_update:
+                WeeklyStats.objects.bulk_update(
+                    weekly_stats_to_update,
+                    [
+                        'total_work_minutes', 'total_intervals_completed',
+                        'total_breaks_taken', 'total_sessions', 'active_days',
+                        'total_breaks_compliant', 'weekly_compliance_rate',
+                        'average_daily_work_minutes', 'average_daily_breaks',
+                        'weekly_productivity_score'
+                    ],
+                    batch_size=500
+                )
 
-    def _update_monthly_stats(self, users):
+    def _update_monthly_stats(self, user_ids):
         """Update monthly aggregated statistics"""
         self.stdout.write('Updating monthly statistics...')
 
         # Get current month
-        today = date.today()
-        month_start = today.replace(day=1)
-
-        for user in users:
-            self._calculate_monthly_stats(user, month_start.year, month_start.month)
+        today = self.today
+        year, month = today.year, today.month
 
-    def _calculate_monthly_stats(self, user, year, month):
-        """Calculate monthly statistics for a user"""
-        # Get daily stats for the month
-        daily_stats = DailyStats.objects.filter(
-            user=user,
+        # One grouped aggregate for every user's month
+        monthly_aggs = DailyStats.objects.filter(
+            user_id__in=user_ids,
             date__year=year,
             date__month=month
+        ).values('user_id').annotate(
+            work_minutes=Sum('total_work_minutes'),
+            intervals=Sum('total_intervals_completed'),
+            breaks=Sum('total_breaks_taken'),
+            sessions=Sum('total_sessions'),
+            active_days=Count('id', filter=Q(total_sessions__gt=0)),
+            avg_compliance=Avg('compliance_rate')
         )
 
-        if daily_stats.exists():
-            monthly_stat, created = MonthlyStats.objects.get_or_create(
-                user=user,
+        existing_monthly = {
+            stat.user_id: stat for stat in MonthlyStats.objects.filter(
+                user_id__in=user_ids,
                 year=year,
-                month=month,
-                defaults={
-                    'total_work_minutes': 0,
-                    'total_intervals_completed': 0,
-                    'total_breaks_taken': 0,
-                    'total_sessions': 0,
-                    'active_days': 0,
-                    'monthly_goal_minutes': 0,
-                    'goal_achieved': False,
-                    'estimated_eye_strain_reduction': 0.0
-                }
+                month=month
             )
+        }
+
+        peak_days, peak_hours = self._monthly_peaks(user_ids, year, month)
 
-            # Calculate aggregated values
-            total_work_minutes = sum(stat.total_work_minutes for stat in daily_stats)
-            total_intervals = sum(stat.total_intervals_completed for stat in daily_stats)
-            total_breaks = sum(stat.total_breaks_taken for stat in daily_stats)
-            total_sessions = sum(stat.total_sessions for stat in daily_stats)
-            active_days = daily_stats.filter(total_sessions__gt=0).count()
+        monthly_stats_to_create = []
+        monthly_stats_to_update = []
+
+        for stats_data in monthly_aggs:
+            monthly_stat = existing_monthly.get(stats_data['user_id'])
+            if monthly_stat is None:
+                monthly_stat = MonthlyStats(
+                    user_id=stats_data['user_id'],
+                    year=year,
+                    month=month
+                )
+                monthly_stats_to_create.append(monthly_stat)
+            else:
+                monthly_stats_to_update.append(monthly_stat)
 
-            # Update monthly stats
-            monthly_stat.total_work_minutes = total_work_minutes
-            monthly_stat.total_intervals_completed = total_intervals
-            monthly_stat.total_breaks_taken = total_breaks
-            monthly_stat.total_sessions = total_sessions
-            monthly_stat.active_days = active_days
+            monthly_stat.total_work_minutes = stats_data['work_minutes']
+            monthly_stat.total_intervals_completed = stats_data['intervals']
+            monthly_stat.total_breaks_taken = stats_data['breaks']
+            monthly_stat.total_sessions = stats_data['sessions']
+            monthly_stat.active_days = stats_data['active_days']
+            monthly_stat.most_productive_day_of_week = peak_days.get(stats_data['user_id'], '')
+            monthly_stat.most_productive_hour = peak_hours.get(stats_data['user_id'])
 
             # Estimate eye strain reduction
-            avg_compliance = sum(stat.compliance_rate for stat in daily_stats) / len(daily_stats)
-            monthly_stat.estimated_eye_strain_reduction = min(50, avg_compliance * 0.5)
+            monthly_stat.estimated_eye_strain_reduction = min(50, stats_data['avg_compliance'] * 0.5)
+
+        with transaction.atomic():
+            if monthly_stats_to_create:
+                MonthlyStats.objects.bulk_create(monthly_stats_to_create, batch_size=500)
+
+            if monthly_stats_to_update:
+                MonthlyStats.objects.bulk_update(
+                    monthly_stats_to_update,
+                    [
+                        'total_work_minutes', 'total_intervals_completed',
+                        'total_breaks_taken', 'total_sessions', 'active_days',
+                        'most_productive_day_of_week', 'most_productive_hour',
+                        'estimated_eye_strain_reduction'
+                    ],
+                    batch_size=500
+                )
+
+    def _monthly_peaks(self, user_ids, year, month):
+        """
+        Find each user's most productive weekday and hour of the month
+
+        Work minutes are grouped per (user, weekday) and per (user, hour) in the
+        database, so one query each covers every user; ordering by minutes lets
+        the first row of each user's group be the peak. Ties go to the earliest
+        weekday (Monday first) and the earliest hour.
+        """
+        by_weekday = DailyStats.objects.filter(
+            user_id__in=user_ids,
+            date__year=year,
+            date__month=month,
+            total_work_minutes__gt=0
+        ).annotate(
+            weekday=ExtractIsoWeekDay('date')
+        ).values('user_id', 'weekday').annotate(
+            minutes=Sum('total_work_minutes')
+        ).order_by('user_id', '-minutes', 'weekday')  # weekday breaks ties
+
+        by_hour = TimerSession.objects.filter(
+            user_id__in=user_ids,
+            start_time__year=year,
+            start_time__month=month,
+            total_work_minutes__gt=0
+        ).annotate(
+            hour=ExtractHour('start_time')
+        ).values('user_id', 'hour').annotate(
+            minutes=Sum('total_work_minutes')
+        ).order_by('user_id', '-minutes', 'hour')  # hour breaks ties
+
+        peak_days = {
+            user_id: calendar.day_name[next(rows)['weekday'] - 1]
+            for user_id, rows in groupby(by_weekday, key=itemgetter('user_id'))
+        }
+        peak_hours = {
+            user_id: next(rows)['hour']
+            for user_id, rows in groupby(by_hour, key=itemgetter('user_id'))
+        }
+        return peak_days, peak_hours
 
-            monthly_stat.save()
+    def _chunked(self, iterable, size):
+        """Yield lists of up to ``size`` items from an iterable"""
+        iterator = iter(iterable)
+        while chunk := list(islice(iterator, size)):
+            yield chunk
 
     def _daterange(self, start_date, end_date):
         """Generate date range"""
-        for n in range(int((end_date - start_date).days) + 1):
-            yield start_date + timedelta(n)
\ No newline at end of file
+        current = start_date
+        while current <= end_date:
+            yield current
+            current += ONE_DAY
\ No newline at end of file
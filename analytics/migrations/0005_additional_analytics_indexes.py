@@ -1,11 +1,13 @@
 # Performance optimization migration for analytics indexes
 
-from django.db import migrations, connection
+from django.db import migrations
 
 
 def apply_indexes(apps, schema_editor):
     """Apply indexes based on database backend"""
-    db_vendor = connection.vendor
+    db_vendor = schema_editor.connection.vendor
+    # SQLite stores booleans as integers
+    true_literal = 'true' if db_vendor == 'postgresql' else '1'
 
     with schema_editor.connection.cursor() as cursor:
         # Add indexes for daily stats aggregation queries
@@ -20,14 +22,22 @@ def apply_indexes(apps, schema_editor):
 
         # Add indexes for user session tracking
         cursor.execute(
-            "CREATE INDEX IF NOT EXISTS analytics_user_session_active_recent_idx ON analytics_user_session (is_active, last_activity) WHERE is_active = true;"
+            "CREATE INDEX IF NOT EXISTS analytics_user_session_active_recent_idx ON analytics_user_session (is_active, last_activity) "
+            f"WHERE is_active = {true_literal};"
         )
 
-        # PostgreSQL-compatible date index without requiring IMMUTABLE
-        # Index on login_time directly instead of DATE(login_time)
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS analytics_user_session_today_breaks_idx ON analytics_user_session (login_time, breaks_taken_in_session);"
-        )
+        if db_vendor == 'postgresql':
+            # DATE(timestamptz) is not IMMUTABLE; the UTC cast is, and it
+            # matches what login_time__date compiles to with TIME_ZONE = 'UTC'
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS analytics_user_session_today_breaks_idx ON analytics_user_session "
+                "(((login_time AT TIME ZONE 'UTC')::date), breaks_taken_in_session);"
+            )
+        else:
+            # Index on login_time directly instead of DATE(login_time)
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS analytics_user_session_today_breaks_idx ON analytics_user_session (login_time, breaks_taken_in_session);"
+            )
 
         # Add indexes for satisfaction analytics
         cursor.execute(
@@ -36,7 +46,8 @@ def apply_indexes(apps, schema_editor):
 
         # Add indexes for live activity feed
         cursor.execute(
-            "CREATE INDEX IF NOT EXISTS analytics_live_activity_public_recent_idx ON analytics_live_activity_feed (is_public, timestamp) WHERE is_public = true;"
+            "CREATE INDEX IF NOT EXISTS analytics_live_activity_public_recent_idx ON analytics_live_activity_feed (is_public, timestamp) "
+            f"WHERE is_public = {true_literal};"
         )
 
         # Add indexes for real-time metrics
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.16 on 2026-10-17 21:07
+
+from django.db import migrations, models
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
+
+
+def backfill_compliance_rate(apps, schema_editor):
+    """Populate the stored compliance rate for existing rows"""
+    DailyStats = apps.get_model('analytics', 'DailyStats')
+    DailyStats.objects.filter(total_breaks_taken__gt=0).update(
+        compliance_rate=Cast('breaks_compliant', FloatField()) * 100 / F('total_breaks_taken')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0007_add_realtime_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dailystats',
+            name='compliance_rate',
+            field=models.FloatField(default=0.0, editable=False),
+        ),
+        migrations.RunPython(backfill_compliance_rate, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='dailystats',
+            index=models.Index(condition=models.Q(('compliance_rate', 100.0)), fields=['user', 'compliance_rate'], name='daily_stats_perfect_idx'),
+        ),
+    ]
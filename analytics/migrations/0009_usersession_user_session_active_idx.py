@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-17 21:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0008_dailystats_compliance_rate'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usersession',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['last_activity'], name='user_session_active_idx'),
+        ),
+    ]
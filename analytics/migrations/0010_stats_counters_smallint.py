@@ -0,0 +1,108 @@
+# Generated by Django 4.2.16 on 2026-10-17 21:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0009_usersession_user_session_active_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='dailystats',
+            name='breaks_compliant',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='dailystats',
+            name='breaks_on_time',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='dailystats',
+            name='total_breaks_taken',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='dailystats',
+            name='total_intervals_completed',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='dailystats',
+            name='total_sessions',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='dailystats',
+            name='total_work_minutes',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='monthlystats',
+            name='active_days',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='monthlystats',
+            name='month',
+            field=models.PositiveSmallIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name='monthlystats',
+            name='most_productive_hour',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='monthlystats',
+            name='total_breaks_taken',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='monthlystats',
+            name='total_intervals_completed',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='monthlystats',
+            name='total_sessions',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='usersession',
+            name='breaks_taken_in_session',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='usersession',
+            name='timer_sessions_started',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='weeklystats',
+            name='active_days',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='weeklystats',
+            name='total_breaks_compliant',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='weeklystats',
+            name='total_breaks_taken',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='weeklystats',
+            name='total_intervals_completed',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='weeklystats',
+            name='total_sessions',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
@@ -1,9 +1,49 @@
 from typing import Optional, Dict, Any, List, Union
-from django.db import models
+from django.db import connection, models
+from django.db.models import Avg, Count, Q
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from datetime import date, timedelta
 
+# Short-lived caches for hot dashboard reads; the values are approximate anyway
+ACTIVE_USERS_CACHE_KEY = 'analytics:active_users_5m'
+ACTIVE_USERS_CACHE_TIMEOUT = 10  # seconds
+LATEST_METRICS_CACHE_KEY = 'analytics:realtime_metrics_latest'
+LATEST_METRICS_CACHE_TIMEOUT = 15  # seconds
+# Running count of today's breaks, keyed by UTC date so it rolls over at midnight
+BREAKS_TODAY_CACHE_KEY = 'analytics:breaks_today:{date}'
+BREAKS_TODAY_CACHE_TIMEOUT = 25 * 60 * 60  # seconds, outlives the day it counts
+# Satisfaction aggregates; the version is bumped whenever a rating is saved
+SATISFACTION_CACHE_KEY = 'analytics:satisfaction:v{version}:{name}:{days}'
+SATISFACTION_CACHE_TIMEOUT = 60  # seconds
+SATISFACTION_CACHE_VERSION_KEY = 'analytics:satisfaction_version'
+# DailyStats fields the stored compliance_rate is derived from
+COMPLIANCE_RATE_INPUTS = {'breaks_compliant', 'total_breaks_taken'}
+
+
+class DailyStatsQuerySet(models.QuerySet):
+    """
+    Keeps the stored compliance rate in sync on bulk writes, which bypass save()
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.update_compliance_rate()
+        update_fields = kwargs.get('update_fields')
+        if update_fields and COMPLIANCE_RATE_INPUTS & set(update_fields) and 'compliance_rate' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'compliance_rate']
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.update_compliance_rate()
+        if COMPLIANCE_RATE_INPUTS & set(fields) and 'compliance_rate' not in fields:
+            fields = [*fields, 'compliance_rate']
+        return super().bulk_update(objs, fields, *args, **kwargs)
+
 
 class DailyStats(models.Model):
     """
@@ -13,15 +53,17 @@ class DailyStats(models.Model):
     date = models.DateField(default=timezone.now)
     
     # Work statistics
-    total_work_minutes = models.PositiveIntegerField(default=0)
-    total_intervals_completed = models.PositiveIntegerField(default=0)
-    total_breaks_taken = models.PositiveIntegerField(default=0)
-    total_sessions = models.PositiveIntegerField(default=0)
+    total_work_minutes = models.PositiveSmallIntegerField(default=0)
+    total_intervals_completed = models.PositiveSmallIntegerField(default=0)
+    total_breaks_taken = models.PositiveSmallIntegerField(default=0)
+    total_sessions = models.PositiveSmallIntegerField(default=0)
     
     # Compliance statistics
-    breaks_on_time = models.PositiveIntegerField(default=0)  # Breaks taken within 1 min of reminder
-    breaks_compliant = models.PositiveIntegerField(default=0)  # Breaks that followed 20-20-20 rule
+    breaks_on_time = models.PositiveSmallIntegerField(default=0)  # Breaks taken within 1 min of reminder
+    breaks_compliant = models.PositiveSmallIntegerField(default=0)  # Breaks that followed 20-20-20 rule
     average_break_duration = models.FloatField(default=0.0)
+    # Stored copy of breaks_compliant / total_breaks_taken so it can be filtered and indexed
+    compliance_rate = models.FloatField(default=0.0, editable=False)
     
     # Streak tracking
     streak_maintained = models.BooleanField(default=False)
@@ -31,6 +73,8 @@ class DailyStats(models.Model):
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    objects = DailyStatsQuerySet.as_manager()
     
     class Meta:
         db_table = 'analytics_daily_stats'
@@ -41,16 +85,29 @@ class DailyStats(models.Model):
         indexes = [
             models.Index(fields=['user', 'date']),
             models.Index(fields=['date']),
+            models.Index(
+                fields=['user', 'compliance_rate'],
+                condition=models.Q(compliance_rate=100.0),
+                name='daily_stats_perfect_idx'
+            ),
         ]
     
     def __str__(self):
         return f"{self.user.email} - {self.date}"
     
-    @property
-    def compliance_rate(self) -> float:
+    def save(self, *args, **kwargs):
+        self.update_compliance_rate()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and COMPLIANCE_RATE_INPUTS & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'compliance_rate'}
+        super().save(*args, **kwargs)
+    
+    def update_compliance_rate(self) -> None:
+        """Recompute the stored compliance rate (called by save() and the bulk writes)"""
         if self.total_breaks_taken == 0:
-            return 0.0
-        return (self.breaks_compliant / self.total_breaks_taken) * 100
+            self.compliance_rate = 0.0
+        else:
+            self.compliance_rate = (self.breaks_compliant / self.total_breaks_taken) * 100
 
 
 class WeeklyStats(models.Model):
@@ -63,19 +120,19 @@ class WeeklyStats(models.Model):
     
     # Aggregated work statistics
     total_work_minutes = models.PositiveIntegerField(default=0)
-    total_intervals_completed = models.PositiveIntegerField(default=0)
-    total_breaks_taken = models.PositiveIntegerField(default=0)
-    total_sessions = models.PositiveIntegerField(default=0)
+    total_intervals_completed = models.PositiveSmallIntegerField(default=0)
+    total_breaks_taken = models.PositiveSmallIntegerField(default=0)
+    total_sessions = models.PositiveSmallIntegerField(default=0)
     
     # Days active this week
-    active_days = models.PositiveIntegerField(default=0)
+    active_days = models.PositiveSmallIntegerField(default=0)
     
     # Weekly averages
     average_daily_work_minutes = models.FloatField(default=0.0)
     average_daily_breaks = models.FloatField(default=0.0)
     
     # Compliance statistics
-    total_breaks_compliant = models.PositiveIntegerField(default=0)
+    total_breaks_compliant = models.PositiveSmallIntegerField(default=0)
     weekly_compliance_rate = models.FloatField(default=0.0)
     
     # Performance
@@ -101,20 +158,20 @@ class MonthlyStats(models.Model):
     """
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='monthly_stats')
     year = models.PositiveIntegerField()
-    month = models.PositiveIntegerField()  # 1-12
+    month = models.PositiveSmallIntegerField()  # 1-12
     
     # Aggregated work statistics
     total_work_minutes = models.PositiveIntegerField(default=0)
-    total_intervals_completed = models.PositiveIntegerField(default=0)
-    total_breaks_taken = models.PositiveIntegerField(default=0)
-    total_sessions = models.PositiveIntegerField(default=0)
+    total_intervals_completed = models.PositiveSmallIntegerField(default=0)
+    total_breaks_taken = models.PositiveSmallIntegerField(default=0)
+    total_sessions = models.PositiveSmallIntegerField(default=0)
     
     # Days active this month
-    active_days = models.PositiveIntegerField(default=0)
+    active_days = models.PositiveSmallIntegerField(default=0)
     
     # Monthly patterns
     most_productive_day_of_week = models.CharField(max_length=10, blank=True)  # Monday, Tuesday, etc.
-    most_productive_hour = models.PositiveIntegerField(null=True, blank=True)  # 0-23
+    most_productive_hour = models.PositiveSmallIntegerField(null=True, blank=True)  # 0-23
     
     # Monthly goals and achievements
     monthly_goal_minutes = models.PositiveIntegerField(default=0)
@@ -182,6 +239,11 @@ class UserBehaviorEvent(models.Model):
     def __str__(self):
         return f"{self.user.email} - {self.get_event_type_display()} - {self.timestamp}"
 
+    @classmethod
+    def bulk_log(cls, events: List['UserBehaviorEvent']) -> List['UserBehaviorEvent']:
+        """Insert unsaved events in batches of ANALYTICS_EVENT_BATCH_SIZE"""
+        return cls.objects.bulk_create(events, batch_size=settings.ANALYTICS_EVENT_BATCH_SIZE)
+
 
 class EngagementMetrics(models.Model):
     """
@@ -236,8 +298,8 @@ class UserSession(models.Model):
     device_type = models.CharField(max_length=20, blank=True)  # mobile, desktop, tablet
     
     # Activity tracking
-    timer_sessions_started = models.PositiveIntegerField(default=0)
-    breaks_taken_in_session = models.PositiveIntegerField(default=0)
+    timer_sessions_started = models.PositiveSmallIntegerField(default=0)
+    breaks_taken_in_session = models.PositiveSmallIntegerField(default=0)
     pages_viewed = models.PositiveIntegerField(default=0)
     
     class Meta:
@@ -248,6 +310,12 @@ class UserSession(models.Model):
         indexes = [
             models.Index(fields=['is_active', 'last_activity']),
             models.Index(fields=['user', 'is_active']),
+            # Only active sessions matter for the real-time active user count
+            models.Index(
+                fields=['last_activity'],
+                condition=models.Q(is_active=True),
+                name='user_session_active_idx'
+            ),
         ]
     
     def __str__(self):
@@ -262,19 +330,68 @@ class UserSession(models.Model):
     
     @classmethod
     def get_active_users_count(cls) -> int:
-        """Get count of currently active users"""
-        cutoff_time = timezone.now() - timedelta(minutes=5)  # Active within last 5 minutes
-        return cls.objects.filter(
-            is_active=True,
-            last_activity__gte=cutoff_time
-        ).count()
+        """Get count of currently active users (cached for a few seconds)"""
+        def count_active_users() -> int:
+            cutoff_time = timezone.now() - timedelta(minutes=5)  # Active within last 5 minutes
+            return cls.objects.filter(
+                is_active=True,
+                last_activity__gte=cutoff_time
+            ).count()
+
+        return cache.get_or_set(ACTIVE_USERS_CACHE_KEY, count_active_users, ACTIVE_USERS_CACHE_TIMEOUT)
+    
+    def record_break(self) -> None:
+        """
+        Count a break taken in this session (caller saves the session)
+
+        Also bumps today's cached break counter when the session belongs to
+        today. A missing counter is left alone; the next read seeds it.
+        """
+        self.breaks_taken_in_session += 1
+
+        today_start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        if self.login_time and self.login_time >= today_start:
+            try:
+                cache.incr(BREAKS_TODAY_CACHE_KEY.format(date=today_start.date().isoformat()))
+            except ValueError:
+                pass
     
     @classmethod
     def get_real_time_breaks_count(cls) -> int:
-        """Get total breaks taken today across all active sessions"""
-        today = timezone.now().date()
+        """
+        Get total breaks taken today across all active sessions
+
+        Served from a counter maintained by record_break(); on a cold cache the
+        counter is seeded from the database once.
+        """
+        today_start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        cache_key = BREAKS_TODAY_CACHE_KEY.format(date=today_start.date().isoformat())
+
+        total_breaks = cache.get(cache_key)
+        if total_breaks is None:
+            total_breaks = cls._count_breaks_since(today_start)
+            cache.add(cache_key, total_breaks, BREAKS_TODAY_CACHE_TIMEOUT)
+        return total_breaks
+
+    @classmethod
+    def reconcile_breaks_count(cls) -> int:
+        """Overwrite today's break counter with the database total"""
+        today_start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        total_breaks = cls._count_breaks_since(today_start)
+        cache.set(
+            BREAKS_TODAY_CACHE_KEY.format(date=today_start.date().isoformat()),
+            total_breaks,
+            BREAKS_TODAY_CACHE_TIMEOUT
+        )
+        return total_breaks
+
+    @classmethod
+    def _count_breaks_since(cls, day_start) -> int:
+        """Sum breaks of sessions that logged in on the day starting at day_start"""
+        # Plain datetime range so the login_time index can be used
         return cls.objects.filter(
-            login_time__date=today
+            login_time__gte=day_start,
+            login_time__lt=day_start + timedelta(days=1)
         ).aggregate(
             total_breaks=models.Sum('breaks_taken_in_session')
         )['total_breaks'] or 0
@@ -334,33 +451,56 @@ class UserSatisfactionRating(models.Model):
     
     def __str__(self):
         return f"{self.user.email} - {self.rating}★ - {self.get_context_display()}"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Retire every cached satisfaction aggregate at once
+        try:
+            cache.incr(SATISFACTION_CACHE_VERSION_KEY)
+        except ValueError:
+            pass
+
+    @classmethod
+    def _cached_aggregate(cls, name: str, days: int, compute) -> float:
+        """Return a satisfaction aggregate from the cache, computing it on a miss"""
+        version = cache.get_or_set(SATISFACTION_CACHE_VERSION_KEY, 1, None)
+        cache_key = SATISFACTION_CACHE_KEY.format(version=version, name=name, days=days)
+        return cache.get_or_set(cache_key, compute, SATISFACTION_CACHE_TIMEOUT)
     
     @classmethod
     def get_average_satisfaction(cls, days: int = 30) -> float:
-        """Get average satisfaction rating for last N days"""
-        cutoff_date = timezone.now() - timedelta(days=days)
-        ratings = cls.objects.filter(rating_date__gte=cutoff_date)
-        if ratings.exists():
-            return ratings.aggregate(avg_rating=models.Avg('rating'))['avg_rating']
-        return 0.0
+        """Get average satisfaction rating for last N days (cached for a minute)"""
+        def compute() -> float:
+            cutoff_date = timezone.now() - timedelta(days=days)
+            avg_rating = cls.objects.filter(
+                rating_date__gte=cutoff_date
+            ).aggregate(avg_rating=Avg('rating'))['avg_rating']
+            return avg_rating or 0.0
+
+        return cls._cached_aggregate('avg_rating', days, compute)
     
     @classmethod
     def get_nps_score(cls, days: int = 30) -> float:
-        """Calculate Net Promoter Score for last N days"""
+        """Calculate Net Promoter Score for last N days (cached for a minute)"""
+        return cls._cached_aggregate('nps', days, lambda: cls._calculate_nps_score(days))
+
+    @classmethod
+    def _calculate_nps_score(cls, days: int) -> float:
+        """Calculate Net Promoter Score for last N days from the database"""
         cutoff_date = timezone.now() - timedelta(days=days)
-        ratings = cls.objects.filter(
+        nps_stats = cls.objects.filter(
             rating_date__gte=cutoff_date,
             recommendation_score__isnull=False
+        ).aggregate(
+            total=Count('id'),
+            promoters=Count('id', filter=Q(recommendation_score__gte=9)),
+            detractors=Count('id', filter=Q(recommendation_score__lte=6))
         )
 
-        if not ratings.exists():
+        if not nps_stats['total']:
             return 0.0
 
-        total_count = ratings.count()
-        promoters = ratings.filter(recommendation_score__gte=9).count()
-        detractors = ratings.filter(recommendation_score__lte=6).count()
-
-        nps = ((promoters - detractors) / total_count) * 100
+        nps = ((nps_stats['promoters'] - nps_stats['detractors']) / nps_stats['total']) * 100
         return round(nps, 1)
 
 
@@ -400,15 +540,30 @@ class RealTimeMetrics(models.Model):
     
     def __str__(self):
         return f"Metrics - {self.timestamp} - {self.active_users_count} active users"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # A new or refreshed row supersedes whatever get_latest_metrics cached
+        cache.delete(LATEST_METRICS_CACHE_KEY)
     
     @classmethod
     def get_latest_metrics(cls) -> 'RealTimeMetrics':
-        """Get the most recent metrics or create default"""
+        """
+        Get the most recent metrics or create default (cached for a few seconds)
+
+        Never aggregates on the caller's thread: the values are refreshed by the
+        update_metrics_periodically Celery task.
+        """
+        latest = cache.get(LATEST_METRICS_CACHE_KEY)
+        if latest is not None:
+            return latest
+
         latest = cls.objects.first()
         if not latest:
-            # Create initial metrics
+            # Create initial (empty) metrics for the periodic task to fill in
             latest = cls.objects.create()
-            latest.update_metrics()
+
+        cache.set(LATEST_METRICS_CACHE_KEY, latest, LATEST_METRICS_CACHE_TIMEOUT)
         return latest
     
     def update_metrics(self) -> None:
@@ -417,105 +572,113 @@ class RealTimeMetrics(models.Model):
 
         Fixed: Added date filtering to prevent unbounded queries
 
-        NOTE: For production, consider running this method via a background job (Celery)
-        to avoid blocking requests. Example Celery task:
-
-        @shared_task
-        def update_realtime_metrics():
-            from analytics.models import RealTimeMetrics
-            latest = RealTimeMetrics.get_latest_metrics()
-            latest.update_metrics()
-
-        Then schedule it to run every 30-60 seconds.
+        Runs in the background via analytics.tasks.update_metrics_periodically
+        (see CELERY_BEAT_SCHEDULE); request handlers should only read the
+        latest row through get_latest_metrics().
         """
         from timer.models import TimerSession, BreakRecord
-        from django.db.models import Q
 
         now = timezone.now()
-        today = now.date()
+        # Day boundaries as datetimes (UTC) rather than __date lookups, so the
+        # plain btree indexes on the timestamp columns serve the range filters
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         cutoff_time = now - timedelta(minutes=5)  # Active within last 5 minutes
         break_cutoff = now - timedelta(minutes=2)  # Break cutoff time
         # Add date range to prevent loading all historical data
-        date_range_start = today - timedelta(days=7)  # Only look at last 7 days for activity
-
-        # Single optimized query for user session metrics
-        # Filter to recent activity only to prevent loading all historical data
-        user_session_stats = UserSession.objects.filter(
-            last_activity__gte=date_range_start
-        ).aggregate(
-            active_users=Count(
-                'id',
-                filter=Q(is_active=True, last_activity__gte=cutoff_time)
-            ),
-            active_sessions=Count('id', filter=Q(is_active=True))
-        )
+        date_range_start = today_start - timedelta(days=7)  # Only look at last 7 days for activity
+
+        # All four aggregates in one round trip: one tagged row per table.
+        # CASE inside COUNT/SUM instead of FILTER so it also runs on SQLite.
+        # Each table is still limited to the last 7 days (30 for ratings).
+        quote = connection.ops.quote_name
+        adapt = connection.ops.adapt_datetimefield_value
+        sql = f"""
+            SELECT 'us',
+                   COUNT(CASE WHEN is_active = %s AND last_activity >= %s THEN 1 END),
+                   COUNT(CASE WHEN is_active = %s THEN 1 END),
+                   0, 0
+              FROM {quote(UserSession._meta.db_table)}
+             WHERE last_activity >= %s
+            UNION ALL
+            SELECT 'ts',
+                   COUNT(CASE WHEN is_active = %s THEN 1 END),
+                   COUNT(CASE WHEN start_time >= %s THEN 1 END),
+                   SUM(CASE WHEN start_time >= %s THEN total_work_minutes END),
+                   0
+              FROM {quote(TimerSession._meta.db_table)}
+             WHERE start_time >= %s
+            UNION ALL
+            SELECT 'br',
+                   COUNT(CASE WHEN break_start_time >= %s AND break_end_time IS NULL THEN 1 END),
+                   COUNT(CASE WHEN break_start_time >= %s THEN 1 END),
+                   0, 0
+              FROM {quote(BreakRecord._meta.db_table)}
+             WHERE break_start_time >= %s
+            UNION ALL
+            SELECT 'sr',
+                   AVG(rating),
+                   COUNT(CASE WHEN recommendation_score >= 9 THEN 1 END),
+                   COUNT(CASE WHEN recommendation_score <= 6 THEN 1 END),
+                   COUNT(recommendation_score)
+              FROM {quote(UserSatisfactionRating._meta.db_table)}
+             WHERE rating_date >= %s
+        """
+        params = [
+            True, adapt(cutoff_time), True, adapt(date_range_start),
+            True, adapt(today_start), adapt(today_start), adapt(date_range_start),
+            adapt(break_cutoff), adapt(today_start), adapt(date_range_start),
+            adapt(now - timedelta(days=30)),
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = {row[0]: row[1:] for row in cursor.fetchall()}
 
-        # Single optimized query for timer session metrics
-        # Filter to today's data only
-        timer_session_stats = TimerSession.objects.filter(
-            start_time__date__gte=date_range_start
-        ).aggregate(
-            users_working=Count('id', filter=Q(is_active=True)),
-            sessions_today=Count('id', filter=Q(start_time__date=today)),
-            work_minutes_today=Sum(
-                'total_work_minutes',
-                filter=Q(start_time__date=today)
-            )
-        )
-
-        # Single optimized query for break metrics
-        # Filter to today's data only
-        break_stats = BreakRecord.objects.filter(
-            break_start_time__date__gte=date_range_start
-        ).aggregate(
-            users_in_break=Count(
-                'id',
-                filter=Q(
-                    break_start_time__gte=break_cutoff,
-                    break_end_time__isnull=True
-                )
-            ),
-            total_breaks_today=Count(
-                'id',
-                filter=Q(break_start_time__date=today)
-            )
-        )
-
-        # Single optimized query for satisfaction metrics
-        satisfaction_stats = UserSatisfactionRating.objects.filter(
-            rating_date__gte=timezone.now() - timedelta(days=30)
-        ).aggregate(
-            avg_rating=Avg('rating'),
-            total_count=Count('id'),
-            promoters=Count('id', filter=Q(recommendation_score__gte=9)),
-            detractors=Count('id', filter=Q(recommendation_score__lte=6)),
-            nps_count=Count('id', filter=Q(recommendation_score__isnull=False))
-        )
+        user_session_stats = dict(zip(('active_users', 'active_sessions'), rows['us']))
+        timer_session_stats = dict(zip(('users_working', 'sessions_today', 'work_minutes_today'), rows['ts']))
+        break_stats = dict(zip(('users_in_break', 'total_breaks_today'), rows['br']))
+        satisfaction_stats = dict(zip(('avg_rating', 'promoters', 'detractors', 'nps_count'), rows['sr']))
 
         # Update metrics from batch queries
-        self.active_users_count = user_session_stats['active_users'] or 0
-        self.active_sessions_count = user_session_stats['active_sessions'] or 0
-        self.users_working = timer_session_stats['users_working'] or 0
-        self.users_in_break = break_stats['users_in_break'] or 0
-        self.total_breaks_today = break_stats['total_breaks_today'] or 0
-        self.total_work_minutes_today = timer_session_stats['work_minutes_today'] or 0
-        self.total_sessions_today = timer_session_stats['sessions_today'] or 0
+        # (int()/float(): UNION ALL may widen the columns to numeric on PostgreSQL)
+        self.active_users_count = int(user_session_stats['active_users'] or 0)
+        self.active_sessions_count = int(user_session_stats['active_sessions'] or 0)
+        self.users_working = int(timer_session_stats['users_working'] or 0)
+        self.users_in_break = int(break_stats['users_in_break'] or 0)
+        self.total_breaks_today = int(break_stats['total_breaks_today'] or 0)
+        self.total_work_minutes_today = int(timer_session_stats['work_minutes_today'] or 0)
+        self.total_sessions_today = int(timer_session_stats['sessions_today'] or 0)
 
         # Calculate satisfaction metrics from single query
-        self.average_satisfaction_rating = satisfaction_stats['avg_rating'] or 0.0
+        self.average_satisfaction_rating = float(satisfaction_stats['avg_rating'] or 0.0)
 
         # Calculate NPS score
         nps_count = satisfaction_stats['nps_count'] or 0
         if nps_count > 0:
             promoters = satisfaction_stats['promoters'] or 0
             detractors = satisfaction_stats['detractors'] or 0
-            self.nps_score = ((promoters - detractors) / nps_count) * 100
+            self.nps_score = float((promoters - detractors) / nps_count) * 100
         else:
             self.nps_score = 0.0
 
         # Update timestamp
         self.timestamp = now
-        self.save()
+
+        if self.pk is None:
+            self.save()
+            return
+
+        # Write only the recomputed columns with a single UPDATE - no full
+        # model save or signal dispatch
+        metric_fields = [
+            'active_users_count', 'active_sessions_count', 'users_working',
+            'users_in_break', 'total_breaks_today', 'total_work_minutes_today',
+            'total_sessions_today', 'average_satisfaction_rating', 'nps_score',
+            'timestamp',
+        ]
+        type(self).objects.filter(pk=self.pk).update(
+            **{field: getattr(self, field) for field in metric_fields}
+        )
+        cache.delete(LATEST_METRICS_CACHE_KEY)
 
 
 class LiveActivityFeed(models.Model):
@@ -550,6 +713,11 @@ class LiveActivityFeed(models.Model):
     
     def __str__(self):
         return f"{self.user.email} - {self.get_activity_type_display()} - {self.timestamp}"
+
+    @classmethod
+    def bulk_log(cls, activities: List['LiveActivityFeed']) -> List['LiveActivityFeed']:
+        """Insert unsaved activities in batches of ANALYTICS_EVENT_BATCH_SIZE"""
+        return cls.objects.bulk_create(activities, batch_size=settings.ANALYTICS_EVENT_BATCH_SIZE)
     
     @classmethod
     def get_recent_public_activities(cls, limit: int = 10):
@@ -557,7 +725,12 @@ class LiveActivityFeed(models.Model):
         Get recent public activities for live feed
 
         Fixed: Added ordering to prevent inconsistent results
+        Joins the user in the same query and loads only the user fields the
+        feed displays, so iterating the result does not query per row.
         """
-        return cls.objects.filter(is_public=True).order_by('-timestamp')[:limit]
+        return cls.objects.filter(is_public=True).select_related('user').only(
+            'timestamp', 'activity_type', 'activity_data', 'is_public',
+            'user__username', 'user__first_name', 'user__last_name', 'user__email'
+        ).order_by('-timestamp')[:limit]
 
 
@@ -1,28 +1,70 @@
 """
 Analytics service layer for calculations, insights, and reporting
-Handles premium analytics, real-time metrics, and data aggregation
+Handles period analytics, real-time metrics, and data aggregation
 """
 from typing import Dict, List, Optional, Tuple, Union, Any
 from django.db.models import QuerySet
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from django.utils import timezone
 from django.db.models import Sum, Count, Avg, Q, F, Max, Min
-from django.db.models.functions import Extract, TruncDate, TruncHour
+from django.db.models.functions import Extract, TruncDate, TruncHour, TruncWeek
 from django.contrib.auth import get_user_model
 import logging
 
 from .models import (
     DailyStats, WeeklyStats, MonthlyStats, UserBehaviorEvent,
     EngagementMetrics, UserSession, UserSatisfactionRating,
-    RealTimeMetrics, LiveActivityFeed, PremiumAnalyticsReport,
-    PremiumInsight
+    RealTimeMetrics, LiveActivityFeed
 )
 from timer.models import TimerSession, BreakRecord, UserTimerSettings
 from accounts.models import UserStreakData
+from mysite.utils import transpose_rows
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Display labels for rating contexts, resolved without a model instance
+RATING_CONTEXT_DISPLAY = dict(UserSatisfactionRating.RATING_CONTEXTS)
+
+# Labels for the 24 hourly pattern rows
+HOUR_DISPLAYS = tuple(f"{hour:02d}:00" for hour in range(24))
+
+# Day names indexed by Extract('week_day') numbers (1 = Sunday)
+WEEKDAY_NAMES = (None, 'Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday')
+
+
+def _period_bounds(start_date: date, end_date: date) -> Tuple[datetime, datetime]:
+    """
+    Aware datetime bounds [start, end) covering the given dates in the current
+    time zone - same days as a __date__range lookup, but usable by the plain
+    btree indexes on the timestamp columns
+    """
+    period_start = timezone.make_aware(datetime.combine(start_date, time.min))
+    period_end = timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min))
+    return period_start, period_end
+
+
+def _period_sessions(user: User, start_date: date, end_date: date) -> QuerySet[TimerSession]:
+    """Finished timer sessions started within the given date range"""
+    period_start, period_end = _period_bounds(start_date, end_date)
+    return TimerSession.objects.filter(
+        user=user,
+        start_time__gte=period_start,
+        start_time__lt=period_end,
+        is_active=False
+    )
+
+
+def _period_breaks(user: User, start_date: date, end_date: date) -> QuerySet[BreakRecord]:
+    """Completed breaks started within the given date range"""
+    period_start, period_end = _period_bounds(start_date, end_date)
+    return BreakRecord.objects.filter(
+        user=user,
+        break_start_time__gte=period_start,
+        break_start_time__lt=period_end,
+        break_completed=True
+    )
+
 
 class AnalyticsService:
     """Main analytics service for data aggregation and calculations"""
@@ -30,24 +72,25 @@ class AnalyticsService:
     @staticmethod
     def calculate_period_summary(user: User, start_date: date, end_date: date) -> Dict[str, Any]:
         """Calculate comprehensive summary for a date period"""
-        daily_stats = DailyStats.objects.filter(
+        # Use database aggregation for better performance; the row count
+        # doubles as the emptiness check
+        aggregated_stats = DailyStats.objects.filter(
             user=user,
             date__gte=start_date,
             date__lte=end_date
-        )
-
-        if not daily_stats.exists():
-            return AnalyticsService._get_empty_summary()
-
-        # Use database aggregation for better performance
-        aggregated_stats = daily_stats.aggregate(
-            total_sessions=Sum('total_sessions'),
+        ).aggregate(
+            days_recorded=Count('id'),
+            sessions=Sum('total_sessions'),
             total_work_minutes=Sum('total_work_minutes'),
             total_breaks=Sum('total_breaks_taken'),
             total_breaks_compliant=Sum('breaks_compliant'),
-            avg_productivity=Avg('productivity_score')
+            avg_productivity=Avg('productivity_score'),
+            active_days=Count('id', filter=Q(total_sessions__gt=0))
         )
 
+        if not aggregated_stats['days_recorded']:
+            return AnalyticsService._get_empty_summary()
+
         total_breaks = aggregated_stats['total_breaks'] or 0
         compliant_breaks = aggregated_stats['total_breaks_compliant'] or 0
 
@@ -56,15 +99,13 @@ class AnalyticsService:
             if total_breaks > 0 else 0.0
         )
 
-        active_days = daily_stats.filter(total_sessions__gt=0).count()
-
         return {
-            'total_sessions': aggregated_stats['total_sessions'] or 0,
+            'total_sessions': aggregated_stats['sessions'] or 0,
             'total_work_hours': round((aggregated_stats['total_work_minutes'] or 0) / 60.0, 1),
             'total_breaks': total_breaks,
             'avg_compliance': round(avg_compliance, 1),
             'productivity_score': round(aggregated_stats['avg_productivity'] or 0, 1),
-            'active_days': active_days,
+            'active_days': aggregated_stats['active_days'],
             'period_days': (end_date - start_date).days + 1
         }
 
@@ -84,34 +125,68 @@ class AnalyticsService:
     @staticmethod
     def get_productivity_trend(user: User, weeks: int = 4) -> List[Dict[str, Any]]:
         """Get productivity trend for last N weeks"""
-        trends = []
         today = date.today()
+        last_week_start = today - timedelta(weeks=1, days=today.weekday())
+        first_week_start = last_week_start - timedelta(weeks=weeks - 1)
 
+        # One grouped aggregate for all weeks instead of a summary per week
+        weekly_stats = DailyStats.objects.filter(
+            user=user,
+            date__gte=first_week_start,
+            date__lt=last_week_start + timedelta(weeks=1)
+        ).annotate(
+            week=TruncWeek('date')
+        ).values('week').annotate(
+            sessions=Sum('total_sessions'),
+            work_minutes=Sum('total_work_minutes'),
+            breaks=Sum('total_breaks_taken'),
+            breaks_compliant=Sum('breaks_compliant'),
+            avg_productivity=Avg('productivity_score')
+        )
+        weekly_data = {stat['week']: stat for stat in weekly_stats}
+
+        trends = []
         for i in range(weeks):
-            week_start = today - timedelta(weeks=i+1, days=today.weekday())
+            week_start = first_week_start + timedelta(weeks=i)
             week_end = week_start + timedelta(days=6)
 
-            week_summary = AnalyticsService.calculate_period_summary(user, week_start, week_end)
+            stat = weekly_data.get(week_start)
+            if stat:
+                total_breaks = stat['breaks'] or 0
+                compliance_rate = (
+                    (stat['breaks_compliant'] or 0) / total_breaks * 100
+                    if total_breaks > 0 else 0.0
+                )
+                week_summary = {
+                    'productivity_score': round(stat['avg_productivity'] or 0, 1),
+                    'compliance_rate': round(compliance_rate, 1),
+                    'total_sessions': stat['sessions'] or 0,
+                    'work_hours': round((stat['work_minutes'] or 0) / 60.0, 1)
+                }
+            else:
+                week_summary = {
+                    'productivity_score': 0.0,
+                    'compliance_rate': 0.0,
+                    'total_sessions': 0,
+                    'work_hours': 0.0
+                }
+
             trends.append({
-                'week_start': week_start.strftime('%Y-%m-%d'),
-                'week_end': week_end.strftime('%Y-%m-%d'),
-                'productivity_score': week_summary['productivity_score'],
-                'compliance_rate': week_summary['avg_compliance'],
-                'total_sessions': week_summary['total_sessions'],
-                'work_hours': week_summary['total_work_hours']
+                'week_start': week_start.isoformat(),
+                'week_end': week_end.isoformat(),
+                **week_summary
             })
 
-        return list(reversed(trends))  # Chronological order
+        return trends  # Chronological order
 
     @staticmethod
-    def analyze_hourly_patterns(user: User, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+    def analyze_hourly_patterns(user: User, start_date: date, end_date: date,
+                                sessions: Optional[QuerySet[TimerSession]] = None) -> List[Dict[str, Any]]:
         """Analyze productivity patterns by hour of day using database aggregation"""
-        hourly_stats = TimerSession.objects.filter(
-            user=user,
-            start_time__date__gte=start_date,
-            start_time__date__lte=end_date,
-            is_active=False
-        ).annotate(
+        if sessions is None:
+            sessions = _period_sessions(user, start_date, end_date)
+
+        hourly_stats = sessions.annotate(
             hour=Extract('start_time', 'hour')
         ).values('hour').annotate(
             sessions=Count('id'),
@@ -122,30 +197,37 @@ class AnalyticsService:
         # Convert to dictionary for easier lookup
         hourly_data = {stat['hour']: stat for stat in hourly_stats}
 
-        # Fill in missing hours with 0
-        result = []
-        for hour in range(24):
-            if hour in hourly_data:
-                data = hourly_data[hour]
-                result.append({
-                    'hour': hour,
-                    'hour_display': f"{hour:02d}:00",
-                    'sessions': data['sessions'] or 0,
-                    'work_minutes': data['work_minutes'] or 0,
-                    'breaks_taken': data['breaks_taken'] or 0,
-                    'productivity_score': AnalyticsService._calculate_hour_productivity(data)
-                })
-            else:
-                result.append({
-                    'hour': hour,
-                    'hour_display': f"{hour:02d}:00",
-                    'sessions': 0,
-                    'work_minutes': 0,
-                    'breaks_taken': 0,
-                    'productivity_score': 0
-                })
+        return AnalyticsService._format_hourly_patterns(hourly_data)
+
+    @staticmethod
+    def _format_hourly_patterns(hourly_data: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build the 24-hour pattern list from per-hour totals"""
+        return [
+            AnalyticsService._build_hour_row(hour, hourly_data.get(hour))
+            for hour in range(24)
+        ]
+
+    @staticmethod
+    def _build_hour_row(hour: int, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """One hourly pattern row; hours without sessions are filled with 0"""
+        if data is None:
+            return {
+                'hour': hour,
+                'hour_display': HOUR_DISPLAYS[hour],
+                'sessions': 0,
+                'work_minutes': 0,
+                'breaks_taken': 0,
+                'productivity_score': 0
+            }
 
-        return result
+        return {
+            'hour': hour,
+            'hour_display': HOUR_DISPLAYS[hour],
+            'sessions': data['sessions'] or 0,
+            'work_minutes': data['work_minutes'] or 0,
+            'breaks_taken': data['breaks_taken'] or 0,
+            'productivity_score': AnalyticsService._calculate_hour_productivity(data)
+        }
 
     @staticmethod
     def _calculate_hour_productivity(hour_data: Dict[str, Any]) -> float:
@@ -164,14 +246,13 @@ class AnalyticsService:
         return round(base_score + break_bonus, 1)
 
     @staticmethod
-    def analyze_daily_patterns(user: User, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+    def analyze_daily_patterns(user: User, start_date: date, end_date: date,
+                               sessions: Optional[QuerySet[TimerSession]] = None) -> List[Dict[str, Any]]:
         """Analyze productivity patterns by day of week using database aggregation"""
-        daily_stats = TimerSession.objects.filter(
-            user=user,
-            start_time__date__gte=start_date,
-            start_time__date__lte=end_date,
-            is_active=False
-        ).annotate(
+        if sessions is None:
+            sessions = _period_sessions(user, start_date, end_date)
+
+        daily_stats = sessions.annotate(
             weekday=Extract('start_time', 'week_day')
         ).values('weekday').annotate(
             sessions=Count('id'),
@@ -179,15 +260,14 @@ class AnalyticsService:
             breaks_taken=Sum('total_breaks_taken')
         ).order_by('weekday')
 
-        # Map weekday numbers to names
-        weekday_names = {
-            1: 'Sunday', 2: 'Monday', 3: 'Tuesday', 4: 'Wednesday',
-            5: 'Thursday', 6: 'Friday', 7: 'Saturday'
-        }
+        return AnalyticsService._format_daily_patterns(daily_stats)
 
+    @staticmethod
+    def _format_daily_patterns(daily_stats) -> List[Dict[str, Any]]:
+        """Build the weekday pattern list from per-weekday totals ordered by weekday"""
         return [
             {
-                'day': weekday_names[stat['weekday']],
+                'day': WEEKDAY_NAMES[stat['weekday']],
                 'weekday': stat['weekday'],
                 'sessions': stat['sessions'] or 0,
                 'work_minutes': stat['work_minutes'] or 0,
@@ -199,6 +279,46 @@ class AnalyticsService:
             for stat in daily_stats
         ]
 
+    @staticmethod
+    def analyze_hour_and_day_patterns(user: User, start_date: date, end_date: date,
+                                      sessions: Optional[QuerySet[TimerSession]] = None
+                                      ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Analyze hourly and weekday patterns from a single grouped query
+
+        Groups by (hour, weekday) - at most 168 rows - and rolls the cells up
+        into both pattern lists in Python.
+        """
+        if sessions is None:
+            sessions = _period_sessions(user, start_date, end_date)
+
+        cells = sessions.annotate(
+            hour=Extract('start_time', 'hour'),
+            weekday=Extract('start_time', 'week_day')
+        ).values('hour', 'weekday').annotate(
+            sessions=Count('id'),
+            work_minutes=Sum('total_work_minutes'),
+            breaks_taken=Sum('total_breaks_taken')
+        ).order_by()
+
+        hourly_data: Dict[int, Dict[str, Any]] = {}
+        daily_data: Dict[int, Dict[str, Any]] = {}
+        for cell in cells:
+            for totals, key, key_name in ((hourly_data, cell['hour'], 'hour'),
+                                          (daily_data, cell['weekday'], 'weekday')):
+                bucket = totals.setdefault(
+                    key, {key_name: key, 'sessions': 0, 'work_minutes': 0, 'breaks_taken': 0}
+                )
+                bucket['sessions'] += cell['sessions'] or 0
+                bucket['work_minutes'] += cell['work_minutes'] or 0
+                bucket['breaks_taken'] += cell['breaks_taken'] or 0
+
+        hourly_patterns = AnalyticsService._format_hourly_patterns(hourly_data)
+        daily_patterns = AnalyticsService._format_daily_patterns(
+            daily_data[weekday] for weekday in sorted(daily_data)
+        )
+        return hourly_patterns, daily_patterns
+
 
 class BreakAnalyticsService:
     """Service for break pattern analysis and insights"""
@@ -206,14 +326,14 @@ class BreakAnalyticsService:
     @staticmethod
     def analyze_break_patterns(user: User, start_date: date, end_date: date) -> Dict[str, Any]:
         """Comprehensive break pattern analysis using database aggregation"""
-        break_stats = BreakRecord.objects.filter(
-            user=user,
-            break_start_time__date__gte=start_date,
-            break_start_time__date__lte=end_date,
-            break_completed=True
-        ).aggregate(
-            total_breaks=Count('id'),
-            average_duration=Avg('break_duration_seconds'),
+        breaks = _period_breaks(user, start_date, end_date)
+
+        # One per-hour aggregate; the period totals are summed from its rows
+        hourly_stats = list(breaks.annotate(
+            hour=Extract('break_start_time', 'hour')
+        ).values('hour').annotate(
+            break_count=Count('id'),
+            duration_sum=Sum('break_duration_seconds'),
             min_duration=Min('break_duration_seconds'),
             max_duration=Max('break_duration_seconds'),
             compliant_breaks=Count(
@@ -221,17 +341,18 @@ class BreakAnalyticsService:
                 filter=Q(break_duration_seconds__gte=20, looked_at_distance=True)
             ),
             distance_looks=Count('id', filter=Q(looked_at_distance=True))
-        )
+        ).order_by('hour'))
 
-        total_breaks = break_stats['total_breaks'] or 0
-        compliant_breaks = break_stats['compliant_breaks'] or 0
-        distance_looks = break_stats['distance_looks'] or 0
+        total_breaks = sum(stat['break_count'] for stat in hourly_stats)
+        compliant_breaks = sum(stat['compliant_breaks'] for stat in hourly_stats)
+        distance_looks = sum(stat['distance_looks'] for stat in hourly_stats)
+        duration_sum = sum(stat['duration_sum'] for stat in hourly_stats)
 
         patterns = {
             'total_breaks': total_breaks,
-            'average_duration': round(break_stats['average_duration'] or 0, 1),
-            'min_duration': break_stats['min_duration'] or 0,
-            'max_duration': break_stats['max_duration'] or 0,
+            'average_duration': round(duration_sum / total_breaks, 1) if total_breaks > 0 else 0,
+            'min_duration': min((stat['min_duration'] for stat in hourly_stats), default=0),
+            'max_duration': max((stat['max_duration'] for stat in hourly_stats), default=0),
             'compliance_rate': (compliant_breaks / total_breaks * 100) if total_breaks > 0 else 0,
             'distance_look_rate': (distance_looks / total_breaks * 100) if total_breaks > 0 else 0,
             'most_common_hour': None,
@@ -240,9 +361,7 @@ class BreakAnalyticsService:
 
         # Find hourly distribution and most common hour
         if total_breaks > 0:
-            hourly_breaks = BreakAnalyticsService._get_hourly_break_distribution(
-                user, start_date, end_date
-            )
+            hourly_breaks = BreakAnalyticsService._format_hourly_break_distribution(hourly_stats)
             patterns['hourly_distribution'] = hourly_breaks
 
             if hourly_breaks:
@@ -252,31 +371,15 @@ class BreakAnalyticsService:
         return patterns
 
     @staticmethod
-    def _get_hourly_break_distribution(user: User, start_date: date, end_date: date) -> List[Dict[str, Any]]:
-        """Get break distribution by hour"""
-        hourly_stats = BreakRecord.objects.filter(
-            user=user,
-            break_start_time__date__gte=start_date,
-            break_start_time__date__lte=end_date,
-            break_completed=True
-        ).annotate(
-            hour=Extract('break_start_time', 'hour')
-        ).values('hour').annotate(
-            break_count=Count('id'),
-            avg_duration=Avg('break_duration_seconds'),
-            compliance_rate=Count(
-                'id',
-                filter=Q(break_duration_seconds__gte=20, looked_at_distance=True)
-            ) * 100.0 / Count('id')
-        ).order_by('hour')
-
+    def _format_hourly_break_distribution(hourly_stats: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build the per-hour break distribution from grouped break totals"""
         return [
             {
                 'hour': stat['hour'],
                 'hour_display': f"{stat['hour']:02d}:00",
                 'break_count': stat['break_count'],
-                'avg_duration': round(stat['avg_duration'], 1),
-                'compliance_rate': round(stat['compliance_rate'], 1)
+                'avg_duration': round(stat['duration_sum'] / stat['break_count'], 1),
+                'compliance_rate': round(stat['compliant_breaks'] * 100.0 / stat['break_count'], 1)
             }
             for stat in hourly_stats
         ]
@@ -288,25 +391,14 @@ class BreakAnalyticsService:
         start_date = end_date - timedelta(days=days)
 
         # Get break data
-        breaks = BreakRecord.objects.filter(
-            user=user,
-            break_start_time__date__gte=start_date,
-            break_start_time__date__lte=end_date,
-            break_completed=True
-        )
+        breaks = _period_breaks(user, start_date, end_date)
 
         # Get session data for context
-        sessions = TimerSession.objects.filter(
-            user=user,
-            start_time__date__gte=start_date,
-            start_time__date__lte=end_date,
-            is_active=False
-        )
+        sessions = _period_sessions(user, start_date, end_date)
 
-        total_work_hours = sessions.aggregate(
+        total_work_minutes = sessions.aggregate(
             total_minutes=Sum('total_work_minutes')
         )['total_minutes'] or 0
-        total_work_hours = total_work_hours / 60.0
 
         break_stats = breaks.aggregate(
             total_breaks=Count('id'),
@@ -314,11 +406,21 @@ class BreakAnalyticsService:
                 'id',
                 filter=Q(break_duration_seconds__gte=20, looked_at_distance=True)
             ),
-            avg_duration=Avg('break_duration_seconds')
+            duration_sum=Sum('break_duration_seconds')
         )
 
-        total_breaks = break_stats['total_breaks'] or 0
-        compliant_breaks = break_stats['compliant_breaks'] or 0
+        return BreakAnalyticsService._effectiveness_from_totals(
+            total_work_minutes,
+            break_stats['total_breaks'] or 0,
+            break_stats['compliant_breaks'] or 0,
+            break_stats['duration_sum'] or 0
+        )
+
+    @staticmethod
+    def _effectiveness_from_totals(total_work_minutes: int, total_breaks: int,
+                                   compliant_breaks: int, duration_sum: int) -> Dict[str, Any]:
+        """Break effectiveness metrics from a period's work and break totals"""
+        total_work_hours = total_work_minutes / 60.0
 
         # Calculate effectiveness metrics
         if total_breaks > 0 and total_work_hours > 0:
@@ -336,7 +438,7 @@ class BreakAnalyticsService:
                 'recommended_breaks_per_hour': recommended_breaks_per_hour,
                 'frequency_score': round(frequency_score, 1),
                 'effectiveness_score': round(effectiveness_score, 1),
-                'avg_duration': round(break_stats['avg_duration'] or 0, 1),
+                'avg_duration': round(duration_sum / total_breaks, 1),
                 'total_breaks': total_breaks,
                 'compliant_breaks': compliant_breaks,
                 'period_work_hours': round(total_work_hours, 1)
@@ -364,7 +466,11 @@ class HealthImpactService:
         break_effectiveness = BreakAnalyticsService.calculate_break_effectiveness(
             user, (end_date - start_date).days
         )
+        return HealthImpactService._health_metrics_from_effectiveness(break_effectiveness)
 
+    @staticmethod
+    def _health_metrics_from_effectiveness(break_effectiveness: Dict[str, Any]) -> Dict[str, Any]:
+        """Derive health impact metrics from break effectiveness metrics"""
         # Eye strain reduction calculation
         eye_strain_reduction = HealthImpactService._calculate_eye_strain_reduction(
             break_effectiveness
@@ -431,16 +537,45 @@ class HealthImpactService:
             'year': 365
         }
 
-        health_trends = {}
+        requested = [name for name in periods if name in period_days]
+        if not requested:
+            return {}
+
         end_date = date.today()
+        period_starts = {
+            name: _period_bounds(end_date - timedelta(days=period_days[name]), end_date)[0]
+            for name in requested
+        }
 
-        for period_name in periods:
-            if period_name in period_days:
-                days = period_days[period_name]
-                start_date = end_date - timedelta(days=days)
-                health_trends[period_name] = HealthImpactService.calculate_health_metrics(
-                    user, start_date, end_date
-                )
+        # The periods share an end date, so one pass over the widest window with
+        # a filtered aggregate per period replaces a pair of queries per period
+        widest_start = end_date - timedelta(days=max(period_days[name] for name in requested))
+        compliant = Q(break_duration_seconds__gte=20, looked_at_distance=True)
+
+        session_aggregates = {}
+        break_aggregates = {}
+        for name, period_start in period_starts.items():
+            in_sessions = Q(start_time__gte=period_start)
+            in_breaks = Q(break_start_time__gte=period_start)
+            session_aggregates[f'{name}_work_minutes'] = Sum('total_work_minutes', filter=in_sessions)
+            break_aggregates[f'{name}_breaks'] = Count('id', filter=in_breaks)
+            break_aggregates[f'{name}_compliant'] = Count('id', filter=in_breaks & compliant)
+            break_aggregates[f'{name}_duration_sum'] = Sum('break_duration_seconds', filter=in_breaks)
+
+        session_totals = _period_sessions(user, widest_start, end_date).aggregate(**session_aggregates)
+        break_totals = _period_breaks(user, widest_start, end_date).aggregate(**break_aggregates)
+
+        health_trends = {}
+        for name in requested:
+            break_effectiveness = BreakAnalyticsService._effectiveness_from_totals(
+                session_totals[f'{name}_work_minutes'] or 0,
+                break_totals[f'{name}_breaks'] or 0,
+                break_totals[f'{name}_compliant'] or 0,
+                break_totals[f'{name}_duration_sum'] or 0
+            )
+            health_trends[name] = HealthImpactService._health_metrics_from_effectiveness(
+                break_effectiveness
+            )
 
         return health_trends
 
@@ -496,21 +631,23 @@ class SatisfactionAnalyticsService:
             user=user,
             rating_date__gte=start_date,
             rating_date__lte=end_date
-        ).order_by('rating_date')
-
-        trend_data = []
-        for rating in ratings:
-            trend_data.append({
-                'date': rating.rating_date.strftime('%Y-%m-%d'),
-                'rating': rating.rating,
-                'context': rating.get_context_display(),
-                'recommendation_score': rating.recommendation_score,
-                'ease_of_use': rating.ease_of_use_rating,
-                'effectiveness': rating.effectiveness_rating,
-                'helpfulness': rating.reminder_helpfulness
-            })
+        ).order_by('rating_date').values(
+            'rating_date', 'rating', 'context', 'recommendation_score',
+            'ease_of_use_rating', 'effectiveness_rating', 'reminder_helpfulness'
+        )
 
-        return trend_data
+        return [
+            {
+                'date': rating['rating_date'].date().isoformat(),
+                'rating': rating['rating'],
+                'context': RATING_CONTEXT_DISPLAY.get(rating['context'], rating['context']),
+                'recommendation_score': rating['recommendation_score'],
+                'ease_of_use': rating['ease_of_use_rating'],
+                'effectiveness': rating['effectiveness_rating'],
+                'helpfulness': rating['reminder_helpfulness']
+            }
+            for rating in ratings
+        ]
 
     @staticmethod
     def calculate_satisfaction_metrics(user: User, days: int = 30) -> Dict[str, Any]:
@@ -518,13 +655,24 @@ class SatisfactionAnalyticsService:
         end_date = timezone.now()
         start_date = end_date - timedelta(days=days)
 
-        ratings = UserSatisfactionRating.objects.filter(
+        # Averages, counts and NPS buckets in a single aggregate
+        stats = UserSatisfactionRating.objects.filter(
             user=user,
             rating_date__gte=start_date,
             rating_date__lte=end_date
+        ).aggregate(
+            avg_rating=Avg('rating'),
+            avg_ease_of_use=Avg('ease_of_use_rating'),
+            avg_effectiveness=Avg('effectiveness_rating'),
+            avg_helpfulness=Avg('reminder_helpfulness'),
+            total_count=Count('id'),
+            recommend_count=Count('id', filter=Q(would_recommend=True)),
+            nps_total=Count('id', filter=Q(recommendation_score__isnull=False)),
+            promoters=Count('id', filter=Q(recommendation_score__gte=9)),
+            detractors=Count('id', filter=Q(recommendation_score__lte=6))
         )
 
-        if not ratings.exists():
+        if not stats['total_count']:
             return {
                 'average_rating': 0,
                 'total_ratings': 0,
@@ -532,22 +680,9 @@ class SatisfactionAnalyticsService:
                 'would_recommend_percentage': 0
             }
 
-        stats = ratings.aggregate(
-            avg_rating=Avg('rating'),
-            avg_ease_of_use=Avg('ease_of_use_rating'),
-            avg_effectiveness=Avg('effectiveness_rating'),
-            avg_helpfulness=Avg('reminder_helpfulness'),
-            total_count=Count('id'),
-            recommend_count=Count('id', filter=Q(would_recommend=True))
-        )
-
         # Calculate NPS score
-        nps_ratings = ratings.filter(recommendation_score__isnull=False)
-        if nps_ratings.exists():
-            total_nps = nps_ratings.count()
-            promoters = nps_ratings.filter(recommendation_score__gte=9).count()
-            detractors = nps_ratings.filter(recommendation_score__lte=6).count()
-            nps_score = ((promoters - detractors) / total_nps) * 100
+        if stats['nps_total']:
+            nps_score = ((stats['promoters'] - stats['detractors']) / stats['nps_total']) * 100
         else:
             nps_score = 0
 
@@ -564,156 +699,6 @@ class SatisfactionAnalyticsService:
         }
 
 
-class PremiumReportService:
-    """Service for premium analytics report generation"""
-
-    @staticmethod
-    def generate_premium_report(user: User, report_type: str,
-                              start_date: date, end_date: date) -> PremiumAnalyticsReport:
-        """Generate a comprehensive premium analytics report"""
-        # Check if report already exists
-        existing_report = PremiumAnalyticsReport.objects.filter(
-            user=user,
-            report_type=report_type,
-            report_period_start=start_date,
-            report_period_end=end_date
-        ).first()
-
-        if existing_report and existing_report.is_generated:
-            return existing_report
-
-        # Create new report
-        report = PremiumAnalyticsReport.objects.create(
-            user=user,
-            report_type=report_type,
-            report_period_start=start_date,
-            report_period_end=end_date
-        )
-
-        # Generate the report
-        report.generate_report()
-        return report
-
-    @staticmethod
-    def create_insights(user: User) -> List[PremiumInsight]:
-        """Create AI-generated insights for premium user"""
-        insights = []
-
-        # Get user data for analysis
-        user_stats = PremiumReportService._get_user_insights_data(user)
-
-        # Generate insights based on patterns
-        pattern_insights = PremiumReportService._generate_pattern_insights(user, user_stats)
-        health_insights = PremiumReportService._generate_health_insights(user, user_stats)
-        productivity_insights = PremiumReportService._generate_productivity_insights(user, user_stats)
-
-        insights.extend(pattern_insights)
-        insights.extend(health_insights)
-        insights.extend(productivity_insights)
-
-        return insights
-
-    @staticmethod
-    def _get_user_insights_data(user: User) -> Dict[str, Any]:
-        """Get user data for insights generation"""
-        end_date = date.today()
-        start_date = end_date - timedelta(days=30)
-
-        return {
-            'period_summary': AnalyticsService.calculate_period_summary(user, start_date, end_date),
-            'break_patterns': BreakAnalyticsService.analyze_break_patterns(user, start_date, end_date),
-            'health_metrics': HealthImpactService.calculate_health_metrics(user, start_date, end_date),
-            'hourly_patterns': AnalyticsService.analyze_hourly_patterns(user, start_date, end_date),
-            'satisfaction': SatisfactionAnalyticsService.calculate_satisfaction_metrics(user)
-        }
-
-    @staticmethod
-    def _generate_pattern_insights(user: User, user_stats: Dict[str, Any]) -> List[PremiumInsight]:
-        """Generate insights about user patterns"""
-        insights = []
-
-        # Analyze peak productivity hours
-        hourly_patterns = user_stats['hourly_patterns']
-        if hourly_patterns:
-            most_productive = max(hourly_patterns, key=lambda x: x['productivity_score'])
-            if most_productive['productivity_score'] > 50:
-                insight = PremiumInsight.objects.create(
-                    user=user,
-                    insight_type='pattern',
-                    title='Peak Productivity Hours Identified',
-                    description=f"You're most productive around {most_productive['hour_display']} "
-                               f"with a productivity score of {most_productive['productivity_score']}.",
-                    action_suggestion='Schedule your most important tasks during this time period.',
-                    supporting_data={'peak_hour': most_productive['hour'], 'score': most_productive['productivity_score']},
-                    confidence_score=0.8,
-                    priority='medium'
-                )
-                insights.append(insight)
-
-        return insights
-
-    @staticmethod
-    def _generate_health_insights(user: User, user_stats: Dict[str, Any]) -> List[PremiumInsight]:
-        """Generate health-related insights"""
-        insights = []
-
-        health_metrics = user_stats['health_metrics']
-        compliance_rate = health_metrics['compliance_rate']
-
-        if compliance_rate < 60:
-            insight = PremiumInsight.objects.create(
-                user=user,
-                insight_type='health',
-                title='Low Break Compliance Detected',
-                description=f"Your break compliance rate is {compliance_rate}%, "
-                           "which may increase eye strain risk.",
-                action_suggestion='Try setting shorter break durations to build the habit gradually.',
-                supporting_data={'compliance_rate': compliance_rate},
-                confidence_score=0.9,
-                priority='high'
-            )
-            insights.append(insight)
-        elif compliance_rate > 85:
-            insight = PremiumInsight.objects.create(
-                user=user,
-                insight_type='health',
-                title='Excellent Break Compliance!',
-                description=f"Your break compliance rate of {compliance_rate}% is outstanding! "
-                           f"This could reduce eye strain by up to {health_metrics['eye_strain_reduction']}%.",
-                action_suggestion='Keep up the great work and consider sharing your success with others.',
-                supporting_data={'compliance_rate': compliance_rate, 'eye_strain_reduction': health_metrics['eye_strain_reduction']},
-                confidence_score=0.95,
-                priority='low'
-            )
-            insights.append(insight)
-
-        return insights
-
-    @staticmethod
-    def _generate_productivity_insights(user: User, user_stats: Dict[str, Any]) -> List[PremiumInsight]:
-        """Generate productivity-related insights"""
-        insights = []
-
-        period_summary = user_stats['period_summary']
-        productivity_score = period_summary['productivity_score']
-
-        if productivity_score > 0:
-            if productivity_score < 40:
-                insight = PremiumInsight.objects.create(
-                    user=user,
-                    insight_type='productivity',
-                    title='Productivity Improvement Opportunity',
-                    description=f"Your productivity score of {productivity_score} suggests room for improvement.",
-                    action_suggestion='Focus on consistent daily usage and regular break-taking to boost your score.',
-                    supporting_data={'productivity_score': productivity_score},
-                    confidence_score=0.75,
-                    priority='medium'
-                )
-                insights.append(insight)
-
-        return insights
-
-
 class ChartDataService:
     """Service for preparing chart data for frontend visualization"""
 
@@ -723,20 +708,24 @@ class ChartDataService:
         end_date = date.today()
         start_date = end_date - timedelta(days=days)
 
-        # Get daily statistics with prefetch optimization
-        daily_stats = DailyStats.objects.filter(
+        # Plain tuples are enough for the series; skip building model instances
+        fields = ('date', 'total_work_minutes', 'total_breaks_taken', 'compliance_rate', 'productivity_score')
+        daily_rows = DailyStats.objects.filter(
             user=user,
             date__gte=start_date,
             date__lte=end_date
-        ).order_by('date')
+        ).order_by('date').values_list(*fields)
+        dates, work_minutes, breaks_taken, compliance_rates, productivity_scores = (
+            transpose_rows(daily_rows, len(fields))
+        )
 
         # Basic time series data
         chart_data = {
-            'dates': [stat.date.strftime('%Y-%m-%d') for stat in daily_stats],
-            'work_minutes': [stat.total_work_minutes for stat in daily_stats],
-            'breaks_taken': [stat.total_breaks_taken for stat in daily_stats],
-            'compliance_rates': [stat.compliance_rate for stat in daily_stats],
-            'productivity_scores': [stat.productivity_score for stat in daily_stats]
+            'dates': [stat_date.isoformat() for stat_date in dates],
+            'work_minutes': list(work_minutes),
+            'breaks_taken': list(breaks_taken),
+            'compliance_rates': list(compliance_rates),
+            'productivity_scores': list(productivity_scores)
         }
 
         # Use batch processing for pattern analysis to reduce database load
@@ -748,11 +737,10 @@ class ChartDataService:
     @staticmethod
     def _get_patterns_batch(user: User, start_date: date, end_date: date) -> Dict[str, Any]:
         """Get all pattern analysis data in optimized batch queries"""
-        # Single query for hourly patterns with all needed data
-        hourly_patterns = AnalyticsService.analyze_hourly_patterns(user, start_date, end_date)
-
-        # Single query for daily patterns with all needed data
-        daily_patterns = AnalyticsService.analyze_daily_patterns(user, start_date, end_date)
+        # Single (hour, weekday) query for both hourly and daily patterns
+        hourly_patterns, daily_patterns = AnalyticsService.analyze_hour_and_day_patterns(
+            user, start_date, end_date
+        )
 
         # Single query for break patterns with all needed data
         break_patterns = BreakAnalyticsService.analyze_break_patterns(user, start_date, end_date)
@@ -2,7 +2,9 @@
 Celery tasks for analytics and real-time metrics
 """
 import logging
+from io import StringIO
 from celery import shared_task
+from django.core.management import call_command
 from django.utils import timezone
 from datetime import date, timedelta
 from .models import RealTimeMetrics, UserSession, DailyStats, WeeklyStats, MonthlyStats
@@ -22,16 +24,17 @@ def update_metrics_periodically():
         update_real_time_metrics()
         
         # Clean up old user sessions (inactive for more than 1 hour)
-        cutoff_time = timezone.now() - timedelta(hours=1)
+        now = timezone.now()
+        cutoff_time = now - timedelta(hours=1)
         UserSession.objects.filter(
             last_activity__lt=cutoff_time,
             is_active=True
         ).update(
             is_active=False,
-            logout_time=timezone.now()
+            logout_time=now
         )
         
-        return f"Metrics updated at {timezone.now()}"
+        return f"Metrics updated at {now}"
     except Exception as e:
         return f"Error updating metrics: {str(e)}"
 
@@ -139,6 +142,31 @@ def cleanup_old_metrics():
         return f"Error cleaning up metrics: {str(e)}"
 
 
+@shared_task
+def reconcile_breaks_counter():
+    """
+    Rewrite today's cached break counter from the database to undo any drift
+    """
+    try:
+        total_breaks = UserSession.reconcile_breaks_count()
+        return f"Break counter reconciled at {total_breaks}"
+    except Exception as e:
+        return f"Error reconciling break counter: {str(e)}"
+
+
+@shared_task
+def refresh_stats_rollups():
+    """
+    Refresh the current WeeklyStats and MonthlyStats rows from DailyStats
+    (run late each night, before the day rolls over)
+    """
+    try:
+        call_command('update_user_statistics', rollups_only=True, stdout=StringIO())
+        return f"Statistics rollups refreshed at {timezone.now()}"
+    except Exception as e:
+        return f"Error refreshing statistics rollups: {str(e)}"
+
+
 @shared_task
 def update_user_streaks():
     """
@@ -190,25 +218,36 @@ def generate_weekly_insights():
         from django.conf import settings
         
         # Get users who should receive weekly reports
-        users_for_reports = User.objects.filter(
+        users_for_reports = list(User.objects.filter(
             is_active=True,
             weekly_report=True,
-        )[:100]  # Limit batch size
+        )[:100])  # Limit batch size
         
         reports_sent = 0
-        
-        for user in users_for_reports:
-            # Calculate weekly stats
-            week_start = date.today() - timedelta(days=7)
-            from django.db.models import Sum, Avg
-            weekly_stats = DailyStats.objects.filter(
-                user=user,
+
+        # Weekly stats for the whole batch in one grouped query
+        week_start = date.today() - timedelta(days=7)
+        from django.db.models import Sum
+        stats_by_user = {
+            row['user']: row
+            for row in DailyStats.objects.filter(
+                user__in=[user.id for user in users_for_reports],
                 date__gte=week_start
-            ).aggregate(
+            ).values('user').annotate(
                 total_work_minutes=Sum('total_work_minutes'),
                 total_breaks=Sum('total_breaks_taken'),
                 total_breaks_compliant=Sum('breaks_compliant')
-            )
+            ).order_by()
+        }
+        
+        for user in users_for_reports:
+            # Users without rows get the same None sums a per-user aggregate returned
+            row = stats_by_user.get(user.id, {})
+            weekly_stats = {
+                'total_work_minutes': row.get('total_work_minutes'),
+                'total_breaks': row.get('total_breaks'),
+                'total_breaks_compliant': row.get('total_breaks_compliant'),
+            }
 
             # Calculate average compliance
             total_breaks = weekly_stats['total_breaks'] or 0
@@ -9,17 +9,24 @@ from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from django.urls import reverse
 from django.test.utils import override_settings
+from django.core.cache import cache
+from django.core.management import call_command
 from django.db.models import Count, Sum, Avg
 from freezegun import freeze_time
 import json
+from io import StringIO
 
 from analytics.models import (
     DailyStats, WeeklyStats, MonthlyStats, UserBehaviorEvent,
     EngagementMetrics, UserSession, UserSatisfactionRating,
-    RealTimeMetrics, LiveActivityFeed, PremiumAnalyticsReport, PremiumInsight
+    RealTimeMetrics, LiveActivityFeed
 )
 from accounts.models import User, UserProfile, UserLevel, UserStreakData
 from timer.models import TimerSession, TimerInterval, BreakRecord, UserTimerSettings
+from analytics.bulk_operations import BulkStatsService, BulkGamificationService
+from analytics.tasks import refresh_stats_rollups
+from accounts.services import BadgeService
+from accounts.gamification_utils import _get_user_statistics as gamification_user_statistics
 
 User = get_user_model()
 
@@ -128,6 +135,112 @@ class TestDailyStatsModel(TestCase):
         assert all_stats[1].date == dates[1]  # Yesterday
         assert all_stats[2].date == dates[0]  # Two days ago
 
+    def test_daily_stats_save_stores_compliance_rate(self):
+        """Test that saving DailyStats keeps the stored compliance rate in sync"""
+        stats = DailyStats.objects.create(
+            user=self.user,
+            date=date.today(),
+            total_breaks_taken=4,
+            breaks_compliant=3
+        )
+        stats.refresh_from_db()
+        assert stats.compliance_rate == 75.0
+
+        # Partial saves still write the rate when its inputs change
+        stats.breaks_compliant = 4
+        stats.save(update_fields=['breaks_compliant'])
+        stats.refresh_from_db()
+        assert stats.compliance_rate == 100.0
+
+        stats.total_breaks_taken = 8
+        stats.save(update_fields=['total_breaks_taken'])
+        stats.refresh_from_db()
+        assert stats.compliance_rate == 50.0
+
+    def test_bulk_writes_keep_compliance_rate_in_sync(self):
+        """Test that bulk_create, bulk_update and upserts recompute the stored rate"""
+        today = date.today()
+        DailyStats.objects.bulk_create([
+            DailyStats(user=self.user, date=today, total_breaks_taken=4, breaks_compliant=2)
+        ])
+        stats = DailyStats.objects.get(user=self.user, date=today)
+        assert stats.compliance_rate == 50.0
+
+        # Only an input field is listed; the rate is written alongside it
+        stats.breaks_compliant = 4
+        DailyStats.objects.bulk_update([stats], ['breaks_compliant'])
+        assert DailyStats.objects.get(pk=stats.pk).compliance_rate == 100.0
+
+        DailyStats.objects.bulk_create(
+            [DailyStats(user=self.user, date=today, total_breaks_taken=8, breaks_compliant=4)],
+            update_conflicts=True,
+            unique_fields=['user', 'date'],
+            update_fields=['total_breaks_taken']
+        )
+        assert DailyStats.objects.get(pk=stats.pk).compliance_rate == 50.0
+
+    def test_bulk_stats_service_stores_compliance_rate(self):
+        """Test that the daily stats upsert writes the compliance rate on insert and update"""
+        today = date.today()
+        other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        # Stale row that the upsert must overwrite
+        DailyStats.objects.create(
+            user=self.user,
+            date=today,
+            total_breaks_taken=1,
+            breaks_compliant=1
+        )
+
+        session = TimerSession.objects.create(
+            user=self.user,
+            is_active=False,
+            total_breaks_taken=2,
+            total_work_minutes=40
+        )
+        interval = TimerInterval.objects.create(session=session, interval_number=1)
+        BreakRecord.objects.create(
+            user=self.user, session=session, interval=interval,
+            break_completed=True, break_duration_seconds=25, looked_at_distance=True
+        )
+        BreakRecord.objects.create(
+            user=self.user, session=session, interval=interval,
+            break_completed=True, break_duration_seconds=10
+        )
+
+        BulkStatsService.update_daily_stats_bulk([self.user, other_user], today)
+
+        assert DailyStats.objects.get(user=self.user, date=today).compliance_rate == 50.0
+        assert DailyStats.objects.get(user=other_user, date=today).compliance_rate == 0.0
+
+    def test_perfect_days_use_stored_compliance_rate(self):
+        """Test that every perfect-day count reads the stored (indexed) compliance rate"""
+        today = date.today()
+        for days_ago, breaks, compliant in [(0, 3, 3), (1, 6, 6), (2, 4, 3), (3, 0, 0)]:
+            DailyStats.objects.create(
+                user=self.user,
+                date=today - timedelta(days=days_ago),
+                total_breaks_taken=breaks,
+                breaks_compliant=compliant
+            )
+
+        def perfect_day_counts():
+            bulk_stats = BulkGamificationService._get_user_stats_bulk([self.user])
+            return (
+                BadgeService._get_user_statistics(self.user)['perfect_days'],
+                bulk_stats[self.user.id]['perfect_days'],
+                gamification_user_statistics(self.user)['perfect_days'],
+            )
+
+        assert perfect_day_counts() == (2, 2, 2)
+
+        # Counts follow the stored column, not the raw break counters
+        DailyStats.objects.filter(user=self.user, date=today).update(compliance_rate=0.0)
+        assert perfect_day_counts() == (1, 1, 1)
+
 
 @pytest.mark.analytics
 @pytest.mark.unit
@@ -246,6 +359,7 @@ class TestUserSessionModel(TestCase):
     """Test UserSession model for real-time tracking"""
 
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
@@ -325,6 +439,41 @@ class TestUserSessionModel(TestCase):
         active_count = UserSession.get_active_users_count()
         assert active_count == 3  # Only recent active sessions
 
+    @freeze_time('2024-06-12 15:00:00')
+    def test_real_time_breaks_count(self):
+        """Test the cached breaks-today counter against the database"""
+        today_session = UserSession.objects.create(
+            user=self.user,
+            session_key='today_session',
+            login_time=timezone.now() - timedelta(hours=2),
+            breaks_taken_in_session=3
+        )
+        yesterday_session = UserSession.objects.create(
+            user=self.user,
+            session_key='yesterday_session',
+            login_time=timezone.now() - timedelta(days=1),
+            breaks_taken_in_session=5
+        )
+
+        # Cold cache seeds from today's sessions only
+        assert UserSession.get_real_time_breaks_count() == 3
+
+        today_session.record_break()
+        today_session.save()
+        assert UserSession.get_real_time_breaks_count() == 4
+
+        # A break in a session from yesterday doesn't count towards today
+        yesterday_session.record_break()
+        yesterday_session.save()
+        assert yesterday_session.breaks_taken_in_session == 6
+        assert UserSession.get_real_time_breaks_count() == 4
+
+        # A write that bypassed record_break() drifts the counter until reconciled
+        UserSession.objects.filter(pk=today_session.pk).update(breaks_taken_in_session=10)
+        assert UserSession.get_real_time_breaks_count() == 4
+        assert UserSession.reconcile_breaks_count() == 10
+        assert UserSession.get_real_time_breaks_count() == 10
+
 
 @pytest.mark.analytics
 @pytest.mark.unit
@@ -332,6 +481,7 @@ class TestUserSatisfactionRatingModel(TestCase):
     """Test UserSatisfactionRating model functionality"""
 
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
@@ -408,6 +558,18 @@ class TestUserSatisfactionRatingModel(TestCase):
         # NPS = (2 - 2) / 5 * 100 = 0
         assert nps == 0.0
 
+    def test_new_rating_invalidates_cached_aggregates(self):
+        """Test that saving a rating retires the cached average and NPS"""
+        UserSatisfactionRating.objects.create(user=self.user, rating=2, recommendation_score=3)
+
+        assert UserSatisfactionRating.get_average_satisfaction(30) == 2.0
+        assert UserSatisfactionRating.get_nps_score(30) == -100.0
+
+        UserSatisfactionRating.objects.create(user=self.user, rating=4, recommendation_score=10)
+
+        assert UserSatisfactionRating.get_average_satisfaction(30) == 3.0
+        assert UserSatisfactionRating.get_nps_score(30) == 0.0
+
 
 @pytest.mark.analytics
 @pytest.mark.unit
@@ -466,142 +628,83 @@ class TestRealTimeMetricsModel(TestCase):
         assert retrieved_metrics.active_users_count == 25
         assert retrieved_metrics.id == latest_metrics.id
 
+    @freeze_time('2024-06-12 15:00:00')
+    def test_update_metrics(self):
+        """Test that update_metrics counts only current and in-range rows"""
+        now = timezone.now()
 
-@pytest.mark.analytics
-@pytest.mark.unit
-class TestPremiumAnalyticsReportModel(TestCase):
-    """Test PremiumAnalyticsReport model functionality"""
-
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123',
-            subscription_type='premium'
+        # User sessions: recent active, idle active, inactive, and out of range
+        UserSession.objects.create(
+            user=self.user, session_key='active', last_activity=now - timedelta(minutes=1)
         )
-
-    def test_create_premium_report(self):
-        """Test creating premium analytics report"""
-        start_date = date.today() - timedelta(days=30)
-        end_date = date.today()
-
-        report = PremiumAnalyticsReport.objects.create(
-            user=self.user,
-            report_type='monthly',
-            report_period_start=start_date,
-            report_period_end=end_date,
-            total_sessions=45,
-            total_work_hours=90.0,
-            total_breaks=180,
-            compliance_rate=82.5,
-            productivity_score=85.0,
-            peak_productivity_hours=[9, 10, 14],
-            most_productive_days=['Monday', 'Tuesday'],
-            break_patterns={'morning': 0.3, 'afternoon': 0.7},
-            improvement_suggestions=[
-                {'type': 'timing', 'message': 'Consider morning sessions'}
-            ],
-            estimated_eye_strain_reduction=75.0,
-            estimated_productivity_boost=12.5,
-            health_score=88.0,
-            vs_previous_period={'sessions': 15.2, 'compliance': 5.1},
-            is_generated=True,
-            generated_at=timezone.now(),
-            generation_time_seconds=3
-        )
-
-        assert report.user == self.user
-        assert report.report_type == 'monthly'
-        assert report.report_period_start == start_date
-        assert report.report_period_end == end_date
-        assert report.total_sessions == 45
-        assert report.total_work_hours == 90.0
-        assert report.compliance_rate == 82.5
-        assert report.productivity_score == 85.0
-        assert report.peak_productivity_hours == [9, 10, 14]
-        assert report.most_productive_days == ['Monday', 'Tuesday']
-        assert report.health_score == 88.0
-        assert report.is_generated is True
-
-
-@pytest.mark.analytics
-@pytest.mark.unit
-class TestPremiumInsightModel(TestCase):
-    """Test PremiumInsight model functionality"""
-
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123',
-            subscription_type='premium'
+        UserSession.objects.create(
+            user=self.user, session_key='idle', last_activity=now - timedelta(minutes=10)
         )
-
-    def test_create_premium_insight(self):
-        """Test creating premium insight"""
-        insight = PremiumInsight.objects.create(
-            user=self.user,
-            insight_type='pattern',
-            title='You work best in the morning',
-            description='Your productivity peaks between 9-11 AM with 85% compliance rate.',
-            action_suggestion='Schedule important tasks during morning hours.',
-            supporting_data={
-                'morning_compliance': 0.85,
-                'afternoon_compliance': 0.65,
-                'peak_hours': [9, 10, 11]
-            },
-            confidence_score=0.92,
-            priority='high',
-            expires_at=timezone.now() + timedelta(days=7)
-        )
-
-        assert insight.user == self.user
-        assert insight.insight_type == 'pattern'
-        assert insight.title == 'You work best in the morning'
-        assert insight.confidence_score == 0.92
-        assert insight.priority == 'high'
-        assert insight.supporting_data['morning_compliance'] == 0.85
-        assert insight.is_active is True
-        assert insight.viewed_at is None
-        assert insight.dismissed_at is None
-
-    def test_mark_as_viewed(self):
-        """Test marking insight as viewed"""
-        insight = PremiumInsight.objects.create(
-            user=self.user,
-            insight_type='achievement',
-            title='Test insight',
-            description='Test description'
+        UserSession.objects.create(
+            user=self.user, session_key='inactive', is_active=False,
+            last_activity=now - timedelta(minutes=1)
+        )
+        UserSession.objects.create(
+            user=self.user, session_key='old', last_activity=now - timedelta(days=8)
         )
 
-        assert insight.viewed_at is None
-
-        insight.mark_as_viewed()
-
-        assert insight.viewed_at is not None
+        # Timer sessions: two today (one running), one yesterday, one out of range
+        TimerSession.objects.create(
+            user=self.user, start_time=now - timedelta(hours=1), total_work_minutes=30
+        )
+        TimerSession.objects.create(
+            user=self.user, start_time=now - timedelta(hours=3), is_active=False,
+            total_work_minutes=45
+        )
+        yesterday_session = TimerSession.objects.create(
+            user=self.user, start_time=now - timedelta(days=1), is_active=False,
+            total_work_minutes=60
+        )
+        # (only one running session per user, so the stale one belongs to someone else)
+        other_user = User.objects.create_user(
+            username='otheruser', email='other@example.com', password='testpass123'
+        )
+        TimerSession.objects.create(
+            user=other_user, start_time=now - timedelta(days=8), total_work_minutes=90
+        )
 
-        # Calling again should not change the viewed_at time
-        first_viewed_at = insight.viewed_at
-        insight.mark_as_viewed()
-        assert insight.viewed_at == first_viewed_at
+        # Breaks: one in progress, one finished, one stale, one from yesterday
+        interval = TimerInterval.objects.create(session=yesterday_session, interval_number=1)
+        for started, ended in [
+            (now - timedelta(minutes=1), None),
+            (now - timedelta(minutes=30), now - timedelta(minutes=29)),
+            (now - timedelta(minutes=5), None),
+            (now - timedelta(days=1), now - timedelta(days=1)),
+        ]:
+            BreakRecord.objects.create(
+                user=self.user, session=yesterday_session, interval=interval,
+                break_start_time=started, break_end_time=ended
+            )
 
-    def test_dismiss_insight(self):
-        """Test dismissing insight"""
-        insight = PremiumInsight.objects.create(
-            user=self.user,
-            insight_type='recommendation',
-            title='Test insight',
-            description='Test description',
-            is_active=True
+        # Ratings in the last 30 days, plus one older rating that is ignored
+        for rating, score in [(5, 10), (4, 9), (2, 3), (3, None)]:
+            UserSatisfactionRating.objects.create(
+                user=self.user, rating=rating, recommendation_score=score
+            )
+        UserSatisfactionRating.objects.create(
+            user=self.user, rating=1, recommendation_score=0,
+            rating_date=now - timedelta(days=40)
         )
 
-        assert insight.is_active is True
-        assert insight.dismissed_at is None
-
-        insight.dismiss()
+        metrics = RealTimeMetrics.objects.create()
+        metrics.update_metrics()
+        metrics.refresh_from_db()
 
-        assert insight.is_active is False
-        assert insight.dismissed_at is not None
+        assert metrics.active_users_count == 1
+        assert metrics.active_sessions_count == 2
+        assert metrics.users_working == 1
+        assert metrics.total_sessions_today == 2
+        assert metrics.total_work_minutes_today == 75
+        assert metrics.users_in_break == 1
+        assert metrics.total_breaks_today == 3
+        assert metrics.average_satisfaction_rating == 3.5
+        assert round(metrics.nps_score, 2) == 33.33
+        assert metrics.timestamp == now
 
 
 # ===== ANALYTICS INTEGRATION TESTS =====
@@ -725,51 +828,210 @@ class TestAnalyticsIntegration(TestCase):
         assert metrics.active_users_count >= 1
         assert metrics.total_breaks_today >= 1
 
-    def test_premium_analytics_report_generation(self):
-        """Test premium analytics report generation"""
-        # Make user premium
-        self.user.subscription_type = 'premium'
-        self.user.save()
 
-        # Create session data for report
-        start_date = date.today() - timedelta(days=7)
-        end_date = date.today()
+# ===== ANALYTICS PERFORMANCE TESTS =====
 
-        for i in range(7):
-            day = start_date + timedelta(days=i)
-            session_start = timezone.make_aware(
-                datetime.combine(day, datetime.min.time()) + timedelta(hours=9)
-            )
+@pytest.mark.analytics
+@pytest.mark.integration
+class TestRefreshStatsRollupsTask(TestCase):
+    """Test the nightly weekly/monthly rollup task"""
 
-            session = TimerSession.objects.create(
-                user=self.user,
-                start_time=session_start,
-                end_time=session_start + timedelta(hours=2),
-                is_active=False,
-                total_work_minutes=120,
-                total_intervals_completed=6,
-                total_breaks_taken=5
-            )
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        # UTC+9: at 23:45 UTC the user's local day has already rolled over
+        UserProfile.objects.create(user=self.user, timezone='Asia/Tokyo')
+        UserStreakData.objects.create(
+            user=self.user,
+            current_daily_streak=5,
+            best_daily_streak=9
+        )
 
-        # Create report
-        report = PremiumAnalyticsReport.objects.create(
+    @freeze_time('2024-06-12 23:45:00')
+    def test_rollups_leave_local_daily_stats_untouched(self):
+        """Test that the task only rebuilds rollups, not the user's local-day rows"""
+        # Rows written by the live path on the user's local dates
+        DailyStats.objects.create(
+            user=self.user,
+            date=date(2024, 6, 12),
+            total_work_minutes=120,
+            total_sessions=3,
+            total_breaks_taken=4,
+            breaks_compliant=4
+        )
+        DailyStats.objects.create(
             user=self.user,
-            report_type='weekly',
-            report_period_start=start_date,
-            report_period_end=end_date
+            date=date(2024, 6, 13),
+            total_work_minutes=30,
+            total_sessions=1
+        )
+        # 07:30 on 13 June in Tokyo, but 12 June in UTC
+        TimerSession.objects.create(
+            user=self.user,
+            start_time=timezone.now() - timedelta(minutes=75),
+            end_time=timezone.now() - timedelta(minutes=45),
+            is_active=False,
+            total_work_minutes=30
         )
 
-        # Generate report
-        report.generate_report()
+        result = refresh_stats_rollups()
 
-        # Verify report was generated
-        assert report.is_generated is True
-        assert report.total_sessions >= 7
-        assert report.total_work_hours >= 14.0
-        assert report.productivity_score >= 0
+        assert result.startswith('Statistics rollups refreshed')
 
+        stats = DailyStats.objects.get(user=self.user, date=date(2024, 6, 12))
+        assert stats.total_work_minutes == 120
+        assert stats.total_sessions == 3
+        assert stats.compliance_rate == 100.0
+        assert DailyStats.objects.filter(user=self.user).count() == 2
+
+        streak_data = UserStreakData.objects.get(user=self.user)
+        assert streak_data.current_daily_streak == 5
+        assert streak_data.best_daily_streak == 9
+
+        weekly = WeeklyStats.objects.get(user=self.user, week_start_date=date(2024, 6, 10))
+        assert weekly.total_work_minutes == 150
+        assert weekly.total_sessions == 4
+
+        monthly = MonthlyStats.objects.get(user=self.user, year=2024, month=6)
+        assert monthly.total_work_minutes == 150
+        assert monthly.active_days == 2
+
+
+@pytest.mark.analytics
+@pytest.mark.integration
+class TestUpdateUserStatisticsCommand(TestCase):
+    """Test the update_user_statistics management command"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+
+    def _create_session(self, user, day, hour, minutes):
+        """Create a completed session on ``day`` with one compliant and one short break"""
+        start_time = timezone.make_aware(datetime.combine(day, datetime.min.time())) + timedelta(hours=hour)
+        session = TimerSession.objects.create(
+            user=user,
+            start_time=start_time,
+            end_time=start_time + timedelta(minutes=minutes),
+            is_active=False,
+            total_work_minutes=minutes,
+            total_intervals_completed=2,
+            total_breaks_taken=2
+        )
+        interval = TimerInterval.objects.create(session=session, interval_number=1)
+        for duration, looked_at_distance in [(25, True), (10, False)]:
+            BreakRecord.objects.create(
+                user=user,
+                session=session,
+                interval=interval,
+                break_start_time=start_time + timedelta(minutes=20),
+                break_completed=True,
+                break_duration_seconds=duration,
+                looked_at_distance=looked_at_distance
+            )
+        return session
+
+    @freeze_time('2024-06-12 15:00:00')
+    def test_recalculates_daily_stats_streaks_and_rollups(self):
+        """Test a forced run over seeded sessions, then an idempotent re-run"""
+        # Three days in a row, a gap, then a streak that ends yesterday
+        for day, minutes in [(5, 40), (6, 60), (7, 40), (10, 40), (11, 40)]:
+            self._create_session(self.user, date(2024, 6, day), 10, minutes)
+        # A streak that ended before yesterday
+        for day in [8, 9]:
+            self._create_session(self.other_user, date(2024, 6, day), 10, 40)
+
+        call_command('update_user_statistics', days=10, force=True, stdout=StringIO())
+
+        # One row per user for each of the 11 days from 2 June to today
+        assert DailyStats.objects.filter(user=self.user).count() == 11
+        assert DailyStats.objects.filter(user=self.other_user).count() == 11
+
+        stats = DailyStats.objects.get(user=self.user, date=date(2024, 6, 6))
+        assert stats.total_sessions == 1
+        assert stats.total_work_minutes == 60
+        assert stats.total_intervals_completed == 2
+        assert stats.total_breaks_taken == 2
+        assert stats.breaks_compliant == 1
+        assert stats.compliance_rate == 50.0
+        assert stats.average_break_duration == 17.5
+        assert stats.streak_maintained is True
+
+        gap = DailyStats.objects.get(user=self.user, date=date(2024, 6, 8))
+        assert gap.total_sessions == 0
+        assert gap.streak_maintained is False
+
+        streak_data = UserStreakData.objects.get(user=self.user)
+        assert streak_data.current_daily_streak == 2
+        assert streak_data.best_daily_streak == 3
+        assert streak_data.total_sessions_completed == 5
+        assert streak_data.average_session_length == 44.0
+
+        other_streak_data = UserStreakData.objects.get(user=self.other_user)
+        assert other_streak_data.current_daily_streak == 0
+        assert other_streak_data.best_daily_streak == 2
+
+        # Week of Monday 10 June
+        weekly = WeeklyStats.objects.get(user=self.user, week_start_date=date(2024, 6, 10))
+        assert weekly.week_end_date == date(2024, 6, 16)
+        assert weekly.total_work_minutes == 80
+        assert weekly.total_sessions == 2
+        assert weekly.total_breaks_taken == 4
+        assert weekly.total_breaks_compliant == 2
+        assert weekly.active_days == 2
+        assert weekly.weekly_compliance_rate == 50.0
+        assert weekly.average_daily_work_minutes == 40.0
+
+        other_weekly = WeeklyStats.objects.get(user=self.other_user, week_start_date=date(2024, 6, 10))
+        assert other_weekly.total_work_minutes == 0
+        assert other_weekly.active_days == 0
+
+        monthly = MonthlyStats.objects.get(user=self.user, year=2024, month=6)
+        assert monthly.total_work_minutes == 220
+        assert monthly.total_sessions == 5
+        assert monthly.total_breaks_taken == 10
+        assert monthly.active_days == 5
+        assert monthly.most_productive_day_of_week == 'Thursday'
+        assert monthly.most_productive_hour == 10
+
+        other_monthly = MonthlyStats.objects.get(user=self.other_user, year=2024, month=6)
+        assert other_monthly.total_work_minutes == 80
+        assert other_monthly.active_days == 2
+
+        # Without --force existing days are left alone and no rows are added
+        DailyStats.objects.filter(user=self.user, date=date(2024, 6, 6)).update(total_work_minutes=1)
+        row_counts = (DailyStats.objects.count(), WeeklyStats.objects.count(), MonthlyStats.objects.count())
+
+        call_command('update_user_statistics', days=10, stdout=StringIO())
+
+        assert (DailyStats.objects.count(), WeeklyStats.objects.count(), MonthlyStats.objects.count()) == row_counts
+        assert DailyStats.objects.get(user=self.user, date=date(2024, 6, 6)).total_work_minutes == 1
+        assert UserStreakData.objects.get(user=self.user).current_daily_streak == 2
+
+    @freeze_time('2024-06-12 15:00:00')
+    def test_monthly_peaks_break_ties_by_earliest_weekday_and_hour(self):
+        """Test that equal work minutes resolve to the earliest weekday and hour"""
+        # Sunday afternoon seeded before Saturday morning, same minutes each
+        self._create_session(self.user, date(2024, 6, 9), 16, 40)
+        self._create_session(self.user, date(2024, 6, 8), 8, 40)
+
+        call_command('update_user_statistics', days=10, force=True, stdout=StringIO())
+
+        monthly = MonthlyStats.objects.get(user=self.user, year=2024, month=6)
+        assert monthly.most_productive_day_of_week == 'Saturday'
+        assert monthly.most_productive_hour == 8
 
-# ===== ANALYTICS PERFORMANCE TESTS =====
 
 @pytest.mark.analytics
 @pytest.mark.performance
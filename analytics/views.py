@@ -113,7 +113,7 @@ def track_user_activity(request):
                 if event_type == 'session_start':
                     user_session.timer_sessions_started += 1
                 elif event_type == 'break_taken':
-                    user_session.breaks_taken_in_session += 1
+                    user_session.record_break()
                 
                 user_session.save()
             
@@ -246,6 +246,7 @@ def live_activity_feed_api(request):
     """
     activities = LiveActivityFeed.get_recent_public_activities(limit=20)
     
+    now = timezone.now()
     activity_data = []
     for activity in activities:
         activity_data.append({
@@ -253,7 +254,7 @@ def live_activity_feed_api(request):
             'activity_type': activity.get_activity_type_display(),
             'activity_data': activity.activity_data,
             'timestamp': activity.timestamp.isoformat(),
-            'time_ago': time_ago_string(activity.timestamp),
+            'time_ago': time_ago_string(activity.timestamp, now),
         })
     
     return JsonResponse({'activities': activity_data})
@@ -332,11 +333,14 @@ def user_dashboard_metrics_api(request):
     return JsonResponse(data)
 
 
-def time_ago_string(timestamp):
+def time_ago_string(timestamp, now=None):
     """
     Convert timestamp to human-readable "time ago" string
+
+    Pass ``now`` when formatting many timestamps so they share one clock read.
     """
-    now = timezone.now()
+    if now is None:
+        now = timezone.now()
     diff = now - timestamp
     
     if diff.days > 0:
@@ -374,9 +378,10 @@ def admin_dashboard_view(request):
     recent_activities = LiveActivityFeed.objects.all()[:10]
     
     # User satisfaction trend (last 7 days) - using system date for global metrics
+    today = date.today()  # System date for global satisfaction
     satisfaction_trend = []
     for i in range(7):
-        day = date.today() - timedelta(days=i)  # System date for global satisfaction
+        day = today - timedelta(days=i)
         avg_rating = UserSatisfactionRating.objects.filter(
             rating_date__date=day
         ).aggregate(avg=Avg('rating'))['avg'] or 0
@@ -5,6 +5,7 @@ This file contains shared fixtures that can be used across all test modules.
 import pytest
 from datetime import datetime, date, timedelta
 from decimal import Decimal
+from django.core.cache import cache
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from django.test import TestCase, TransactionTestCase
@@ -563,5 +564,5 @@ def pytest_configure(config):
 def cleanup_test_data():
     """Cleanup test data after each test"""
     yield
-    # Any cleanup code would go here if needed
-    pass
\ No newline at end of file
+    # Cached metrics must not leak between tests
+    cache.clear()
\ No newline at end of file
@@ -14,6 +14,7 @@ import os
 from pathlib import Path
 
 import dj_database_url
+from celery.schedules import crontab
 from decouple import Csv, config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -308,6 +309,29 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    # Keeps RealTimeMetrics fresh so dashboards never aggregate on request
+    "update-realtime-metrics": {
+        "task": "analytics.tasks.update_metrics_periodically",
+        "schedule": 30.0,  # seconds
+    },
+    # Retention for the metrics time series: drop rows older than 24 hours
+    "cleanup-old-realtime-metrics": {
+        "task": "analytics.tasks.cleanup_old_metrics",
+        "schedule": 60 * 60.0,  # seconds
+    },
+    # Corrects the cached breaks-today counter if an increment was lost
+    "reconcile-breaks-counter": {
+        "task": "analytics.tasks.reconcile_breaks_counter",
+        "schedule": 15 * 60.0,  # seconds
+    },
+    # Weekly/monthly rollups read by the dashboards; runs before midnight so
+    # the closing day still lands in the current week and month
+    "refresh-stats-rollups": {
+        "task": "analytics.tasks.refresh_stats_rollups",
+        "schedule": crontab(hour=23, minute=45),
+    },
+}
 
 # Calendar Integration Configuration
 GOOGLE_CALENDAR_CONFIG = {
@@ -646,6 +670,10 @@ API_DEFAULT_RATE_LIMIT = config("API_DEFAULT_RATE_LIMIT", default="100/h")
 API_AUTHENTICATED_RATE_LIMIT = config("API_AUTHENTICATED_RATE_LIMIT", default="1000/h")
 API_PREMIUM_RATE_LIMIT = config("API_PREMIUM_RATE_LIMIT", default="5000/h")
 
+# Analytics Configuration
+# Rows per INSERT when writing behavior events / activity feed entries in bulk
+ANALYTICS_EVENT_BATCH_SIZE = config("ANALYTICS_EVENT_BATCH_SIZE", default=500, cast=int)
+
 # Error Pages Configuration
 ERROR_PAGE_TEMPLATES = {
     400: "errors/error.html",
@@ -0,0 +1,14 @@
+"""
+Small helpers shared across the EyeHealth 20-20-20 apps
+"""
+from typing import Iterable, List, Sequence, Tuple
+
+
+def transpose_rows(rows: Iterable[Sequence], width: int) -> List[Tuple]:
+    """
+    Turn row tuples (e.g. from ``values_list``) into one tuple per column
+
+    ``width`` is the number of fields per row, so an empty result still
+    unpacks into that many empty columns.
+    """
+    return list(zip(*rows)) or [()] * width
@@ -0,0 +1,52 @@
+# Covering indexes for per-user, per-day session and break aggregates
+
+from django.db import migrations
+
+
+def apply_indexes(apps, schema_editor):
+    """Apply covering indexes, using INCLUDE where the backend supports it"""
+    supports_include = schema_editor.connection.vendor == 'postgresql'
+
+    with schema_editor.connection.cursor() as cursor:
+        if supports_include:
+            # Index-only scans for daily work/interval sums
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS timer_session_user_start_cover_idx "
+                "ON timer_session (user_id, start_time) "
+                "INCLUDE (total_work_minutes, total_intervals_completed);"
+            )
+            # Index-only scans for daily break counts and compliance
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS timer_break_record_user_start_cover_idx "
+                "ON timer_break_record (user_id, break_start_time) "
+                "INCLUDE (break_duration_seconds, looked_at_distance, break_completed);"
+            )
+        else:
+            # No INCLUDE support: carry the payload columns as trailing keys
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS timer_session_user_start_cover_idx "
+                "ON timer_session (user_id, start_time, total_work_minutes, total_intervals_completed);"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS timer_break_record_user_start_cover_idx "
+                "ON timer_break_record (user_id, break_start_time, break_duration_seconds, "
+                "looked_at_distance, break_completed);"
+            )
+
+
+def reverse_indexes(apps, schema_editor):
+    """Remove indexes"""
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP INDEX IF EXISTS timer_session_user_start_cover_idx;")
+        cursor.execute("DROP INDEX IF EXISTS timer_break_record_user_start_cover_idx;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('timer', '0009_timersession_unique_active_session_per_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(apply_indexes, reverse_indexes),
+    ]
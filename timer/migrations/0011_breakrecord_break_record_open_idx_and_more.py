@@ -0,0 +1,21 @@
+# Generated by Django 4.2.16 on 2026-10-17 21:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('timer', '0010_covering_daily_aggregate_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='breakrecord',
+            index=models.Index(condition=models.Q(('break_end_time__isnull', True)), fields=['break_start_time'], name='break_record_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='timersession',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['start_time'], name='timer_session_active_idx'),
+        ),
+    ]
@@ -39,6 +39,12 @@ class TimerSession(models.Model):
             models.Index(fields=['user', 'start_time']),
             models.Index(fields=['user', 'is_active']),
             models.Index(fields=['start_time']),
+            # Small partial index for real-time "users working" counts
+            models.Index(
+                fields=['start_time'],
+                condition=models.Q(is_active=True),
+                name='timer_session_active_idx'
+            ),
         ]
         constraints = [
             # Prevent multiple active sessions per user
@@ -157,6 +163,12 @@ class BreakRecord(models.Model):
             models.Index(fields=['session', 'break_completed']),
             models.Index(fields=['break_start_time', 'break_completed']),
             models.Index(fields=['user', 'break_completed', 'break_duration_seconds']),
+            # Small partial index for real-time "users in break" counts
+            models.Index(
+                fields=['break_start_time'],
+                condition=models.Q(break_end_time__isnull=True),
+                name='break_record_open_idx'
+            ),
         ]
     
     def __str__(self):
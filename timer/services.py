@@ -643,7 +643,7 @@ class BreakService:
                 user_session = UserSession.objects.filter(session_key=session_key).first()
                 if user_session:
                     if activity_type == 'break_completed':
-                        user_session.breaks_taken_in_session += 1
+                        user_session.record_break()
                     user_session.last_activity = timezone.now()
                     user_session.save()
 
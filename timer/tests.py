@@ -21,7 +21,7 @@ from timer.models import (
 from timer.utils import (
     get_optimized_recent_sessions, get_user_session_statistics_optimized,
     update_user_settings_safely, get_user_break_preferences,
-    cache_user_statistics, invalidate_user_stats_cache
+    cache_user_statistics, invalidate_user_stats_cache, bulk_update_daily_stats
 )
 from accounts.models import User, UserProfile, UserLevel, UserStreakData
 from analytics.models import DailyStats, UserSession, LiveActivityFeed
@@ -968,4 +968,24 @@ class TestTimerUtils(TestCase):
 
             session.end_session()
             assert session.end_time is not None
-            assert session.duration_minutes == 120
\ No newline at end of file
+            assert session.duration_minutes == 120
+
+    def test_bulk_update_daily_stats_stores_compliance_rate(self):
+        """Test that the bulk updater recomputes the rate it bypasses save() for"""
+        today = date.today()
+        DailyStats.objects.create(
+            user=self.user,
+            date=today,
+            total_breaks_taken=4,
+            breaks_compliant=4
+        )
+
+        bulk_update_daily_stats([
+            {'user': self.user, 'date': today, 'total_breaks_taken': 4, 'total_sessions': 1},
+            {'user': self.user, 'date': today - timedelta(days=1), 'total_breaks_taken': 2},
+        ])
+
+        assert DailyStats.objects.get(user=self.user, date=today).compliance_rate == 50.0
+        assert DailyStats.objects.get(
+            user=self.user, date=today - timedelta(days=1)
+        ).compliance_rate == 0.0
@@ -8,6 +8,7 @@ from datetime import date, timedelta
 from .models import TimerSession, BreakRecord, UserTimerSettings, TimerInterval
 from analytics.models import DailyStats
 from accounts.models import UserProfile, UserStreakData
+from mysite.utils import transpose_rows
 
 
 def get_user_dashboard_data(user):
@@ -114,19 +115,24 @@ def get_user_statistics_summary(user, days=30):
         date__lte=end_date
     ).order_by('date')
 
-    if not daily_stats.exists():
-        return _get_empty_statistics_summary(days)
+    # Calculate aggregated statistics in a single query
+    period_stats = daily_stats.aggregate(
+        days_recorded=Count('id'),
+        work_minutes=Sum('total_work_minutes'),
+        intervals=Sum('total_intervals_completed'),
+        breaks=Sum('total_breaks_taken'),
+        sessions=Sum('total_sessions'),
+        active_days=Count('id', filter=Q(total_sessions__gt=0)),
+        avg_work_minutes=Avg('total_work_minutes'),
+        avg_breaks=Avg('total_breaks_taken'),
+        avg_compliance=Avg('compliance_rate')
+    )
 
-    # Calculate aggregated statistics
-    total_work_minutes = sum(stat.total_work_minutes for stat in daily_stats)
-    total_intervals = sum(stat.total_intervals_completed for stat in daily_stats)
-    total_breaks = sum(stat.total_breaks_taken for stat in daily_stats)
-    total_sessions = sum(stat.total_sessions for stat in daily_stats)
-    total_compliant_breaks = sum(stat.breaks_compliant for stat in daily_stats)
+    if not period_stats['days_recorded']:
+        return _get_empty_statistics_summary(days)
 
-    active_days = daily_stats.filter(total_sessions__gt=0).count()
-    avg_compliance = (sum(stat.compliance_rate for stat in daily_stats) /
-                     len(daily_stats)) if daily_stats else 0
+    active_days = period_stats['active_days']
+    avg_compliance = period_stats['avg_compliance']
 
     # Calculate productivity score
     consistency_score = (active_days / days) * 100 if days > 0 else 0
@@ -135,15 +141,15 @@ def get_user_statistics_summary(user, days=30):
     return {
         'period_days': days,
         'active_days': active_days,
-        'total_work_hours': round(total_work_minutes / 60, 1),
-        'total_intervals': total_intervals,
-        'total_breaks': total_breaks,
-        'total_sessions': total_sessions,
+        'total_work_hours': round(period_stats['work_minutes'] / 60, 1),
+        'total_intervals': period_stats['intervals'],
+        'total_breaks': period_stats['breaks'],
+        'total_sessions': period_stats['sessions'],
         'avg_compliance_rate': round(avg_compliance, 1),
         'consistency_score': round(consistency_score, 1),
         'productivity_score': round(productivity_score, 1),
         'chart_data': _prepare_chart_data(daily_stats),
-        'insights': _generate_insights(user, daily_stats)
+        'insights': _generate_insights(user, period_stats)
     }
 
 
@@ -180,20 +186,29 @@ def _prepare_chart_data(daily_stats):
     """
     Prepare chart data from daily statistics
     """
+    # Plain tuples are enough for the series; skip building model instances
+    fields = ('date', 'total_work_minutes', 'total_breaks_taken', 'compliance_rate', 'productivity_score')
+    rows = daily_stats.values_list(*fields)
+    dates, work_minutes, breaks_taken, compliance_rates, productivity_scores = (
+        transpose_rows(rows, len(fields))
+    )
+
     return {
-        'dates': [stat.date.strftime('%Y-%m-%d') for stat in daily_stats],
-        'work_minutes': [stat.total_work_minutes for stat in daily_stats],
-        'breaks_taken': [stat.total_breaks_taken for stat in daily_stats],
-        'compliance_rates': [stat.compliance_rate for stat in daily_stats],
-        'productivity_scores': [stat.productivity_score for stat in daily_stats]
+        'dates': [stat_date.strftime('%Y-%m-%d') for stat_date in dates],
+        'work_minutes': list(work_minutes),
+        'breaks_taken': list(breaks_taken),
+        'compliance_rates': list(compliance_rates),
+        'productivity_scores': list(productivity_scores)
     }
 
 
-def _generate_insights(user, daily_stats):
+def _generate_insights(user, period_stats):
     """
     Generate insights based on user data
+
+    ``period_stats`` is the aggregate built by get_user_statistics_summary.
     """
-    if not daily_stats:
+    if not period_stats['days_recorded']:
         return [{
             'type': 'welcome',
             'title': 'Get Started',
@@ -203,10 +218,9 @@ def _generate_insights(user, daily_stats):
 
     insights = []
 
-    # Calculate averages
-    avg_work_minutes = sum(stat.total_work_minutes for stat in daily_stats) / len(daily_stats)
-    avg_breaks = sum(stat.total_breaks_taken for stat in daily_stats) / len(daily_stats)
-    avg_compliance = sum(stat.compliance_rate for stat in daily_stats) / len(daily_stats)
+    avg_work_minutes = period_stats['avg_work_minutes']
+    avg_breaks = period_stats['avg_breaks']
+    avg_compliance = period_stats['avg_compliance']
 
     # Work time insights
     if avg_work_minutes > 480:  # More than 8 hours
@@ -308,15 +322,23 @@ def get_user_break_preferences(user):
 
     # Calculate smart break duration based on user's history
     if settings.smart_break_enabled:
-        recent_breaks = BreakRecord.objects.filter(
+        # Only two scalar columns are needed; BreakRecord.is_compliant would
+        # also load the user and timer settings once per row
+        recent_breaks = list(BreakRecord.objects.filter(
             user=user,
             break_completed=True,
             break_start_time__gte=timezone.now() - timedelta(days=30)
-        ).order_by('-break_start_time')[:50]
+        ).order_by('-break_start_time').values_list(
+            'break_duration_seconds', 'looked_at_distance'
+        )[:50])
 
         if recent_breaks:
-            avg_duration = sum(br.break_duration_seconds for br in recent_breaks) / len(recent_breaks)
-            completion_rate = sum(1 for br in recent_breaks if br.is_compliant) / len(recent_breaks)
+            expected_duration = settings.get_effective_break_duration()
+            avg_duration = sum(duration for duration, _ in recent_breaks) / len(recent_breaks)
+            completion_rate = sum(
+                1 for duration, looked in recent_breaks
+                if (duration or 0) >= expected_duration and looked
+            ) / len(recent_breaks)
 
             # Adjust preferred duration based on user behavior
             if completion_rate < 0.5 and avg_duration > settings.preferred_break_duration:
@@ -345,29 +367,29 @@ def _get_user_average_break_duration(user):
     """
     Calculate user's average break duration from recent history
     """
-    recent_breaks = BreakRecord.objects.filter(
+    avg_duration = BreakRecord.objects.filter(
         user=user,
         break_completed=True,
         break_start_time__gte=timezone.now() - timedelta(days=30)
-    )
+    ).aggregate(avg=Avg('break_duration_seconds'))['avg']
 
-    if recent_breaks:
-        return sum(br.break_duration_seconds for br in recent_breaks) / recent_breaks.count()
-    return 0
+    return avg_duration or 0
 
 
 def _get_user_break_completion_rate(user):
     """
     Calculate user's break completion rate from recent history
     """
-    recent_breaks = BreakRecord.objects.filter(
+    break_stats = BreakRecord.objects.filter(
         user=user,
         break_start_time__gte=timezone.now() - timedelta(days=30)
+    ).aggregate(
+        total=Count('id'),
+        completed=Count('id', filter=Q(break_completed=True))
     )
 
-    if recent_breaks:
-        completed_breaks = recent_breaks.filter(break_completed=True).count()
-        return (completed_breaks / recent_breaks.count()) * 100
+    if break_stats['total']:
+        return (break_stats['completed'] / break_stats['total']) * 100
     return 0
 
 